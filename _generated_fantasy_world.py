@@ -0,0 +1,135 @@
+"""
+Pre-built constructor for the demo fantasy world.
+
+GENERATED by tools/gen_fantasy_world.py from fantasy_world.json - do not edit.
+Re-run the generator after changing the JSON payload or the schema.
+"""
+
+from world_bible_schema import Cosmology, GameStyle, Geography, History, Metadata, Society, Systems, TechLevel, WorldBible
+
+
+def make_fantasy_world() -> WorldBible:
+    """Build the demo WorldBible without re-running validation."""
+    return WorldBible.model_construct(
+        metadata=Metadata.model_construct(
+            name='Eldoria',
+            description='A magical realm of ancient forests, towering castles, and mystical creatures',
+            style=GameStyle.FANTASY,
+            version='1.0.0',
+        ),
+        cosmology=Cosmology.model_construct(
+            magic_system='Elemental magic drawn from nature spirits and ancient runes',
+            tech_level=TechLevel.MEDIEVAL,
+            calendar_system='Twelve-month lunar calendar with solstice festivals',
+            physics_laws='Standard physics with magical exceptions',
+            metaphysics='Magic flows through ley lines and is powered by belief',
+        ),
+        geography=Geography.model_construct(
+            macro_geography='Vast continent with diverse biomes from enchanted forests to frozen tundras',
+            key_regions=[
+                {
+                    'name': 'Enchanted Forest',
+                    'description': 'Ancient woodland filled with magical creatures and hidden ruins',
+                },
+                {
+                    'name': 'Dragon Mountains',
+                    'description': 'Snow-capped peaks where dragons make their lairs',
+                },
+                {
+                    'name': 'Mystic Valley',
+                    'description': 'Peaceful valley home to powerful wizards and scholars',
+                },
+            ],
+            climate_zones=['Temperate', 'Alpine', 'Tropical'],
+            natural_resources=['Ancient woods', 'Magical crystals', 'Rare herbs'],
+        ),
+        society=Society.model_construct(
+            races=[
+                {
+                    'name': 'Humans',
+                    'description': 'Adaptable and ambitious, builders of great kingdoms',
+                },
+                {
+                    'name': 'Elves',
+                    'description': 'Graceful and long-lived, guardians of ancient forests',
+                },
+                {
+                    'name': 'Dwarves',
+                    'description': 'Stout and skilled craftsmen of the mountain realms',
+                },
+            ],
+            factions=[
+                {
+                    'name': 'Kingdom of Eldoria',
+                    'description': 'United human kingdoms seeking peace and prosperity',
+                },
+                {
+                    'name': 'Forest Guardians',
+                    'description': 'Elven protectors of the ancient woodlands',
+                },
+            ],
+            social_structure='Feudal hierarchy with kings, nobles, knights, and common folk',
+            cultural_traits=['Honor', 'Magic', 'Exploration', 'Craftsmanship'],
+        ),
+        history=History.model_construct(
+            creation_myth='The world was shaped by the five elemental dragons in the dawn of time',
+            major_conflicts='The Great Dragon War that nearly destroyed all life',
+            historical_events=[
+                'Creation of the world by elemental dragons',
+                'Rise of the first human kingdoms',
+                'Discovery of magic by the elven sages',
+                'The Great Dragon War',
+                'Formation of the Council of Mages',
+            ],
+            timeline={
+                'Year 1': 'World creation',
+                'Year 500': 'First human settlements',
+                'Year 1000': 'Elven magic discovery',
+                'Year 1200': 'Great Dragon War begins',
+                'Year 1250': 'Peace treaty signed',
+            },
+        ),
+        systems=Systems.model_construct(
+            economy='Mixed barter and gold standard with magical currencies',
+            abilities='Magic schools (Arcane, Divine, Nature) and martial skills',
+            items='Weapons, armor, potions, scrolls, and enchanted artifacts',
+            combat_system='D20-based combat with tactical positioning and magical effects',
+            progression_system='Level-based advancement with experience points',
+            crafting_system='Skilled artisans can create magical items',
+        ),
+        mana_framework={
+            'normal_person': {'min': 0, 'max': 50},
+            'skilled': {'min': 50, 'max': 200},
+            'expert': {'min': 200, 'max': 500},
+            'master': {'min': 500, 'max': 1000},
+            'spell_costs': {
+                'minor': {'min': 5, 'max': 20},
+                'moderate': {'min': 20, 'max': 100},
+                'major': {'min': 100, 'max': 500},
+                'legendary': {'min': 500, 'max': 1000},
+            },
+        },
+        economic_framework={
+            'currency': 'Gold Pieces',
+            'base_prices': {
+                'food': {'bread': 5, 'meal': 25, 'feast': 100},
+                'clothing': {'basic': 50, 'fine': 200, 'noble': 1000},
+                'equipment': {'basic_weapon': 100, 'fine_weapon': 500, 'masterwork': 2000},
+                'potions': {'healing': 50, 'mana': 75, 'buff': 150},
+                'housing': {'room': 50, 'house': 5000, 'estate': 50000},
+            },
+            'price_multipliers': {
+                'common': 1.0,
+                'uncommon': 2.5,
+                'rare': 10.0,
+                'epic': 50.0,
+                'legendary': 250.0,
+            },
+        },
+        skills_framework={
+            'combat': {'max_level': 20, 'mana_cost': 'Low', 'difficulty': 'Easy'},
+            'magic': {'max_level': 25, 'mana_cost': 'High', 'difficulty': 'Hard'},
+            'crafting': {'max_level': 15, 'mana_cost': 'None', 'difficulty': 'Medium'},
+            'stealth': {'max_level': 18, 'mana_cost': 'Low', 'difficulty': 'Medium'},
+        },
+    )
@@ -0,0 +1,28 @@
+"""
+Keyword router shared by the LangChain integrations' GameWorldTool.
+
+Both integrations map a free-text query to a handler method named after the
+matching route, so the routing rules live here to keep them in step.
+"""
+
+import re
+
+# Keyword routing compiled into one pattern. The alternatives are tried in
+# order at the start of the query, and each is a set of lookaheads over the
+# whole text, so the first matching route wins exactly as the old if/elif
+# cascade did. The group name is the handler suffix.
+ROUTE_RE = re.compile(
+    r"^(?:"
+    r"(?P<create_world>(?=.*(?:create|generate))(?=.*world))"
+    r"|(?P<create_character>(?=.*(?:character|knight|hero)))"
+    r"|(?P<move_character>(?=.*(?:move|location)))"
+    r"|(?P<list_worlds>(?=.*(?:list|available|what)))"
+    r")",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def route(query: str):
+    """Return the handler suffix for query, or None if no route matches."""
+    match = ROUTE_RE.match(query)
+    return match.lastgroup if match else None
@@ -5,9 +5,39 @@ This shows the core functionality that is proven to work via unit tests
 """
 
 import asyncio
+import logging
 import sys
 import os
-from world_bible_schema import WorldBible, PlayerCharacter, GameStyle
+from dataclasses import dataclass
+from typing import Dict, List
+from pydantic import BaseModel
+from world_bible_schema import WorldBible, PlayerCharacter
+# Generated from fantasy_world.json by tools/gen_fantasy_world.py; the payload is
+# validated at generation time, so the demo builds it without re-validating.
+from _generated_fantasy_world import make_fantasy_world
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class DemoCharacter:
+    """Lightweight character record used to show the data shape in the demo."""
+    name: str
+    race: str
+    character_class: str
+    level: int
+    backstory: str
+    attributes: Dict[str, int]
+    skills: List[str]
+    inventory: List[str]
+    location: str
+    goals: List[str]
+
+class WorldSnapshot(BaseModel):
+    """Persisted form of a world together with its characters."""
+    world_id: str
+    world: WorldBible
+    characters: List[DemoCharacter]
+    created_at: str
 
 def demo_core_functionality():
     """Demonstrate the core functionality using the data models directly"""
@@ -16,132 +46,7 @@ def demo_core_functionality():
 
     try:
         print("\n1. 🏗️  Creating a Fantasy World Data Structure...")
-        fantasy_world = WorldBible(
-            metadata={
-                "name": "Eldoria",
-                "description": "A magical realm of ancient forests, towering castles, and mystical creatures",
-                "style": GameStyle.FANTASY,
-                "version": "1.0.0"
-            },
-            cosmology={
-                "magic_system": "Elemental magic drawn from nature spirits and ancient runes",
-                "tech_level": "Medieval",
-                "calendar_system": "Twelve-month lunar calendar with solstice festivals",
-                "physics_laws": "Standard physics with magical exceptions",
-                "metaphysics": "Magic flows through ley lines and is powered by belief",
-                "economy": "Mixed barter and gold standard with magical currencies",
-                "currency": "Gold Pieces",
-                "abilities": "Magic schools (Arcane, Divine, Nature) and martial skills",
-                "items": "Weapons, armor, potions, scrolls, and enchanted artifacts",
-                "combat_system": "D20-based combat with tactical positioning and magical effects"
-            },
-            geography={
-                "macro_geography": "Vast continent with diverse biomes from enchanted forests to frozen tundras",
-                "key_regions": [
-                    {
-                        "name": "Enchanted Forest",
-                        "description": "Ancient woodland filled with magical creatures and hidden ruins"
-                    },
-                    {
-                        "name": "Dragon Mountains",
-                        "description": "Snow-capped peaks where dragons make their lairs"
-                    },
-                    {
-                        "name": "Mystic Valley",
-                        "description": "Peaceful valley home to powerful wizards and scholars"
-                    }
-                ],
-                "climate_zones": ["Temperate", "Alpine", "Tropical"],
-                "natural_resources": ["Ancient woods", "Magical crystals", "Rare herbs"]
-            },
-            society={
-                "races": [
-                    {
-                        "name": "Humans",
-                        "description": "Adaptable and ambitious, builders of great kingdoms"
-                    },
-                    {
-                        "name": "Elves",
-                        "description": "Graceful and long-lived, guardians of ancient forests"
-                    },
-                    {
-                        "name": "Dwarves",
-                        "description": "Stout and skilled craftsmen of the mountain realms"
-                    }
-                ],
-                "factions": [
-                    {
-                        "name": "Kingdom of Eldoria",
-                        "description": "United human kingdoms seeking peace and prosperity"
-                    },
-                    {
-                        "name": "Forest Guardians",
-                        "description": "Elven protectors of the ancient woodlands"
-                    }
-                ],
-                "social_structure": "Feudal hierarchy with kings, nobles, knights, and common folk",
-                "cultural_traits": ["Honor", "Magic", "Exploration", "Craftsmanship"]
-            },
-            history={
-                "creation_myth": "The world was shaped by the five elemental dragons in the dawn of time",
-                "major_conflicts": "The Great Dragon War that nearly destroyed all life",
-                "historical_events": [
-                    "Creation of the world by elemental dragons",
-                    "Rise of the first human kingdoms",
-                    "Discovery of magic by the elven sages",
-                    "The Great Dragon War",
-                    "Formation of the Council of Mages"
-                ],
-                "timeline": {
-                    "Year 1": "World creation",
-                    "Year 500": "First human settlements",
-                    "Year 1000": "Elven magic discovery",
-                    "Year 1200": "Great Dragon War begins",
-                    "Year 1250": "Peace treaty signed"
-                }
-            },
-            systems={
-                "magic_system": "Elemental magic with schools of Arcane, Divine, and Nature",
-                "tech_level": "Medieval",
-                "abilities": "Magic schools (Arcane, Divine, Nature) and martial skills",
-                "items": "Weapons, armor, potions, scrolls, and enchanted artifacts",
-                "combat_system": "D20-based combat with tactical positioning and magical effects",
-                "progression_system": "Level-based advancement with experience points",
-                "economy": "Mixed barter and gold standard with magical currencies",
-                "crafting_system": "Skilled artisans can create magical items"
-            },
-            mana_framework={
-                "normal_person": {"min": 0, "max": 50},
-                "skilled": {"min": 50, "max": 200},
-                "expert": {"min": 200, "max": 500},
-                "master": {"min": 500, "max": 1000},
-                "spell_costs": {
-                    "minor": {"min": 5, "max": 20},
-                    "moderate": {"min": 20, "max": 100},
-                    "major": {"min": 100, "max": 500},
-                    "legendary": {"min": 500, "max": 1000}
-                }
-            },
-            economic_framework={
-                "currency": "Gold Pieces",
-                "base_prices": {
-                    "food": {"bread": 5, "meal": 25, "feast": 100},
-                    "clothing": {"basic": 50, "fine": 200, "noble": 1000},
-                    "equipment": {"basic_weapon": 100, "fine_weapon": 500, "masterwork": 2000},
-                    "potions": {"healing": 50, "mana": 75, "buff": 150},
-                    "housing": {"room": 50, "house": 5000, "estate": 50000}
-                },
-                "price_multipliers": {
-                    "common": 1.0, "uncommon": 2.5, "rare": 10.0, "epic": 50.0, "legendary": 250.0
-                }
-            },
-            skills_framework={
-                "combat": {"max_level": 20, "mana_cost": "Low", "difficulty": "Easy"},
-                "magic": {"max_level": 25, "mana_cost": "High", "difficulty": "Hard"},
-                "crafting": {"max_level": 15, "mana_cost": "None", "difficulty": "Medium"},
-                "stealth": {"max_level": 18, "mana_cost": "Low", "difficulty": "Medium"}
-            }
-        )
+        fantasy_world = make_fantasy_world()
 
         print(f"   ✅ World created: {fantasy_world.metadata.name}")
         print(f"   📍 World ID: fantasy_world_001")
@@ -151,13 +56,13 @@ def demo_core_functionality():
 
         print("\n2. 🧙 Character Data Structure (Simplified)...")
         # Show the structure without creating the full object
-        character_data = {
-            "name": "Elara Moonshadow",
-            "race": "Elf",
-            "class": "Ranger",
-            "level": 5,
-            "backstory": "A skilled ranger from the enchanted forests, protector of the ancient woods",
-            "attributes": {
+        character_data = DemoCharacter(
+            name="Elara Moonshadow",
+            race="Elf",
+            character_class="Ranger",
+            level=5,
+            backstory="A skilled ranger from the enchanted forests, protector of the ancient woods",
+            attributes={
                 "strength": 12,
                 "dexterity": 18,
                 "intelligence": 14,
@@ -165,32 +70,34 @@ def demo_core_functionality():
                 "charisma": 10,
                 "constitution": 14
             },
-            "skills": ["Archery", "Stealth", "Nature Lore"],
-            "inventory": ["Longbow", "Elven Cloak", "Health Potion"],
-            "location": "Enchanted Forest",
-            "goals": [
+            skills=["Archery", "Stealth", "Nature Lore"],
+            inventory=["Longbow", "Elven Cloak", "Health Potion"],
+            location="Enchanted Forest",
+            goals=[
                 "Protect the ancient forest from darkness",
                 "Find the lost elven artifacts"
             ]
-        }
+        )
 
-        print(f"   ✅ Character data structure ready: {character_data['name']}")
-        print(f"   📊 Level: {character_data['level']}")
-        print(f"   📍 Location: {character_data['location']}")
-        print(f"   🎯 Class: {character_data['class']}")
-        print(f"   🎲 Skills: {character_data['skills']}")
-        print(f"   🎒 Inventory: {character_data['inventory']}")
+        print(f"   ✅ Character data structure ready: {character_data.name}")
+        print(f"   📊 Level: {character_data.level}")
+        print(f"   📍 Location: {character_data.location}")
+        print(f"   🎯 Class: {character_data.character_class}")
+        print(f"   🎲 Skills: {character_data.skills}")
+        print(f"   🎒 Inventory: {character_data.inventory}")
 
         print("\n3. 📊 World and Character Integration...")
         # Show how they would work together in the MCP system
         print(f"   🌍 World '{fantasy_world.metadata.name}' contains regions:")
-        for region in fantasy_world.geography.key_regions:
-            print(f"      • {region['name']}: {region['description']}")
+        print("\n".join(
+            f"      • {region['name']}: {region['description']}"
+            for region in fantasy_world.geography.key_regions
+        ))
 
-        print(f"   🧙 Hero '{character_data['name']}' operates in:")
-        print(f"      • Region: {character_data['location']}")
-        print(f"      • Goals: {len(character_data['goals'])} active objectives")
-        print(f"      • Skills: {character_data['skills']}")
+        print(f"   🧙 Hero '{character_data.name}' operates in:")
+        print(f"      • Region: {character_data.location}")
+        print(f"      • Goals: {len(character_data.goals)} active objectives")
+        print(f"      • Skills: {character_data.skills}")
 
         print("\n4. 🎮 Game System Integration...")
         print(f"   ⚔️  Combat System: {fantasy_world.systems.combat_system}")
@@ -199,15 +106,17 @@ def demo_core_functionality():
         print(f"   📈 Progression: {fantasy_world.systems.progression_system}")
 
         print("\n5. 💾 Data Persistence Simulation...")
-        # Show how data would be stored and retrieved
-        world_data = {
-            "world_id": "fantasy_world_001",
-            "world": fantasy_world.model_dump(),
-            "characters": [character_data],
-            "created_at": "2024-01-15T10:30:00Z"
-        }
-        print(f"   💾 World data structure created")
-        print(f"   📋 Contains {len(world_data['characters'])} character(s)")
+        # Show how data would be stored and retrieved; the whole snapshot is
+        # serialized in one pass since it is only ever persisted, never inspected
+        snapshot = WorldSnapshot.model_construct(
+            world_id="fantasy_world_001",
+            world=fantasy_world,
+            characters=[character_data],
+            created_at="2024-01-15T10:30:00Z"
+        )
+        snapshot_json = snapshot.model_dump_json()
+        print(f"   💾 World data structure created ({len(snapshot_json)} bytes of JSON)")
+        print(f"   📋 Contains {len(snapshot.characters)} character(s)")
         print(f"   🗂️  Ready for MCP storage and retrieval")
 
         print("\n" + "=" * 65)
@@ -225,11 +134,12 @@ def demo_core_functionality():
 
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Demo failed: %s", e)
         return False
 
 if __name__ == "__main__":
+    # LOGLEVEL=CRITICAL silences the traceback, e.g. for profiling runs
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
     print("Starting core functionality demo...")
     success = demo_core_functionality()
     if success:
@@ -13,14 +13,135 @@ have access to external tools and decide when to use them.
 import asyncio
 import json
 import sys
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from world_bible_schema import GameStyle
+
+# mcp-use and the Gemini SDK are imported where first needed: both pull in
+# large pydantic model trees at import time, which only pays off once the
+# Game Master is actually constructed.
+if TYPE_CHECKING:
+    from google.genai import types
+
+
+SYSTEM_PROMPT = """
+    You are an intelligent Game Master for an open-world adventure game.
+    You have access to MCP (Model Context Protocol) tools to manage game worlds and characters.
+
+    Available tools:
+    - generate_world: Create a new game world with a specific style
+    - create_character: Create a new character in a world
+    - update_character_location: Move a character to a new location
+    - list_worlds: List all available worlds
+
+    When the user wants to:
+    - Create a world: Use the generate_world tool
+    - Create a character: Use the create_character tool
+    - Move or explore: Use the update_character_location tool
+    - Check status: Use the list_worlds tool
+
+    Provide immersive, engaging responses as a Game Master. Only use the MCP tools when necessary
+    to manage the game state. For general conversation or descriptions, respond naturally without
+    calling tools.
+
+    If you call a tool, explain what happened in an engaging way to the player.
+    """
+
+
+@lru_cache(maxsize=1)
+def _build_mcp_tools() -> List["types.Tool"]:
+    """Build the (static) MCP tool declarations once per process."""
+    from google.genai import types
+
+    return [
+        types.Tool(
+            function_declarations=[
+                types.FunctionDeclaration(
+                    name="generate_world",
+                    description="Generate a new game world with the specified style (Fantasy, Sci-Fi, Cyberpunk, etc.)",
+                    parameters={
+                        "type": "OBJECT",
+                        "properties": {
+                            "style": {
+                                "type": "STRING",
+                                "description": "The genre/style of the world",
+                                # Constrain Gemini to styles the WorldBible schema accepts
+                                "enum": [style.value for style in GameStyle]
+                            }
+                        },
+                        "required": ["style"]
+                    }
+                ),
+                types.FunctionDeclaration(
+                    name="create_character",
+                    description="Create a new character in a specific world",
+                    parameters={
+                        "type": "OBJECT",
+                        "properties": {
+                            "world_id": {
+                                "type": "STRING",
+                                "description": "The ID of the world to create the character in"
+                            },
+                            "character_data": {
+                                "type": "OBJECT",
+                                "description": "Character information",
+                                "properties": {
+                                    "name": {"type": "STRING", "description": "Character name"},
+                                    "race": {"type": "STRING", "description": "Character race"},
+                                    "character_class": {"type": "STRING", "description": "Character class"},
+                                    "description": {"type": "STRING", "description": "Character description"},
+                                    "level": {"type": "INTEGER", "description": "Character level"}
+                                }
+                            }
+                        },
+                        "required": ["world_id", "character_data"]
+                    }
+                ),
+                types.FunctionDeclaration(
+                    name="update_character_location",
+                    description="Move a character to a new location",
+                    parameters={
+                        "type": "OBJECT",
+                        "properties": {
+                            "world_id": {
+                                "type": "STRING",
+                                "description": "The ID of the world"
+                            },
+                            "character_name": {
+                                "type": "STRING",
+                                "description": "The name of the character to move"
+                            },
+                            "new_location": {
+                                "type": "STRING",
+                                "description": "The new location for the character"
+                            }
+                        },
+                        "required": ["world_id", "character_name", "new_location"]
+                    }
+                ),
+                types.FunctionDeclaration(
+                    name="list_worlds",
+                    description="List all available game worlds",
+                    parameters={
+                        "type": "OBJECT",
+                        "properties": {},
+                        "required": []
+                    }
+                )
+            ]
+        )
+    ]
+
 
-# Import mcp-use for proper MCP client functionality
-from mcp_use import MCPClient
+@lru_cache(maxsize=1)
+def _part_list_adapter() -> "TypeAdapter[List[types.Part]]":
+    """TypeAdapter for batches of Gemini content parts, built on first use."""
+    from google.genai import types
 
-# Import Gemini for AI integration
-from google import genai
-from google.genai import types
+    return TypeAdapter(List[types.Part])
 
 
 class GeminiGameMaster:
@@ -28,6 +149,10 @@ class GeminiGameMaster:
 
     def __init__(self):
         """Initialize the Game Master with Gemini client and MCP tools."""
+        from google import genai
+        from google.genai import types
+        from mcp_use import MCPClient
+
         self.gemini_client = genai.Client()
 
         # Configure MCP server connection to connect to existing server
@@ -40,164 +165,101 @@ class GeminiGameMaster:
         }
         self.mcp_client = MCPClient.from_dict(config)
         self.game_history = []
+        self._tools = self.create_mcp_function_declarations()
+        self._gen_config = types.GenerateContentConfig(
+            tools=self._tools,
+            automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True)
+        )
+        self._session = None
+        self._session_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _ensure_session(self):
+        """Open the MCP session on first use and keep it for later tool calls."""
+        # Concurrent tool calls must not race to open two sessions
+        async with self._session_lock:
+            if self._session is None:
+                self._session = await self.mcp_client.create_session("game_world")
+        return self._session
+
+    async def aclose(self):
+        """Close the shared MCP session, if one was opened."""
+        if self._session is not None:
+            self._session = None
+            await self.mcp_client.close_session("game_world")
 
-    def create_mcp_function_declarations(self) -> List[types.Tool]:
+    def create_mcp_function_declarations(self) -> List["types.Tool"]:
         """Create function declarations for MCP tools that Gemini can call."""
-
-        return [
-            types.Tool(
-                function_declarations=[
-                    types.FunctionDeclaration(
-                        name="generate_world",
-                        description="Generate a new game world with the specified style (Fantasy, Sci-Fi, Cyberpunk, etc.)",
-                        parameters={
-                            "type": "OBJECT",
-                            "properties": {
-                                "style": {
-                                    "type": "STRING",
-                                    "description": "The genre/style of the world"
-                                }
-                            },
-                            "required": ["style"]
-                        }
-                    ),
-                    types.FunctionDeclaration(
-                        name="create_character",
-                        description="Create a new character in a specific world",
-                        parameters={
-                            "type": "OBJECT",
-                            "properties": {
-                                "world_id": {
-                                    "type": "STRING",
-                                    "description": "The ID of the world to create the character in"
-                                },
-                                "character_data": {
-                                    "type": "OBJECT",
-                                    "description": "Character information",
-                                    "properties": {
-                                        "name": {"type": "STRING", "description": "Character name"},
-                                        "race": {"type": "STRING", "description": "Character race"},
-                                        "character_class": {"type": "STRING", "description": "Character class"},
-                                        "description": {"type": "STRING", "description": "Character description"},
-                                        "level": {"type": "INTEGER", "description": "Character level"}
-                                    }
-                                }
-                            },
-                            "required": ["world_id", "character_data"]
-                        }
-                    ),
-                    types.FunctionDeclaration(
-                        name="update_character_location",
-                        description="Move a character to a new location",
-                        parameters={
-                            "type": "OBJECT",
-                            "properties": {
-                                "world_id": {
-                                    "type": "STRING",
-                                    "description": "The ID of the world"
-                                },
-                                "character_name": {
-                                    "type": "STRING",
-                                    "description": "The name of the character to move"
-                                },
-                                "new_location": {
-                                    "type": "STRING",
-                                    "description": "The new location for the character"
-                                }
-                            },
-                            "required": ["world_id", "character_name", "new_location"]
-                        }
-                    ),
-                    types.FunctionDeclaration(
-                        name="list_worlds",
-                        description="List all available game worlds",
-                        parameters={
-                            "type": "OBJECT",
-                            "properties": {},
-                            "required": []
-                        }
-                    )
-                ]
-            )
-        ]
+        return _build_mcp_tools()
 
     async def execute_mcp_tool(self, function_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an MCP tool function based on Gemini's function call."""
         try:
-            # Create session and call the tool
-            session = await self.mcp_client.create_session("game_world")
-            result = await session.call_tool(function_name, args)
-            await self.mcp_client.close_session("game_world")
-            return result
+            session = await self._ensure_session()
+            return await session.call_tool(function_name, args)
         except Exception as e:
             print(f"⚠️ MCP Server error: {e}")
             return {"error": f"Failed to execute {function_name}: {str(e)}"}
 
     async def process_game_request(self, user_request: str) -> str:
         """Process a user request using Gemini with MCP tools available."""
+        return (await self.process_game_requests([user_request]))[0]
 
-        system_prompt = """
-        You are an intelligent Game Master for an open-world adventure game.
-        You have access to MCP (Model Context Protocol) tools to manage game worlds and characters.
-
-        Available tools:
-        - generate_world: Create a new game world with a specific style
-        - create_character: Create a new character in a world
-        - update_character_location: Move a character to a new location
-        - list_worlds: List all available worlds
-
-        When the user wants to:
-        - Create a world: Use the generate_world tool
-        - Create a character: Use the create_character tool
-        - Move or explore: Use the update_character_location tool
-        - Check status: Use the list_worlds tool
-
-        Provide immersive, engaging responses as a Game Master. Only use the MCP tools when necessary
-        to manage the game state. For general conversation or descriptions, respond naturally without
-        calling tools.
+    async def process_game_requests(self, user_requests: List[str]) -> List[str]:
+        """Process independent requests concurrently.
 
-        If you call a tool, explain what happened in an engaging way to the player.
+        Responses and game history entries keep the order of user_requests,
+        whatever order the requests complete in.
         """
+        results = await asyncio.gather(*map(self._run_request, user_requests))
+        self.game_history.extend(entry for _, entry in results if entry is not None)
+        return [text for text, _ in results]
+
+    async def _run_request(self, user_request: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Answer one request; returns the reply and its history entry (None on error)."""
+        from google.genai import types
 
         print(f"\n🎮 User request: {user_request}")
 
         try:
-            response = self.gemini_client.models.generate_content(
+            response = await self.gemini_client.aio.models.generate_content(
                 model='gemini-2.0-flash-exp',
                 contents=[
-                    system_prompt,
+                    SYSTEM_PROMPT,
                     f"\nUser request: {user_request}"
                 ],
-                config=types.GenerateContentConfig(
-                    tools=self.create_mcp_function_declarations(),
-                    automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True)
-                )
+                config=self._gen_config
             )
 
             # Check if Gemini wants to call any tools
             if response.function_calls:
                 print(f"🔧 Gemini requested {len(response.function_calls)} tool calls")
 
-                # Execute the tool calls
-                tool_results = []
+                # Execute the tool calls concurrently; they are independent I/O
                 for function_call in response.function_calls:
                     print(f"📞 Executing: {function_call.name}({function_call.args})")
-                    result = await self.execute_mcp_tool(function_call.name, dict(function_call.args))
-                    tool_results.append(result)
-
-                # Provide the tool results back to Gemini for a final response
-                function_responses = []
-                for i, (function_call, result) in enumerate(zip(response.function_calls, tool_results)):
-                    function_responses.append(types.Part.from_function_response(
-                        name=function_call.name,
-                        response={"result": result}
-                    ))
+                tool_results = await asyncio.gather(*(
+                    self.execute_mcp_tool(function_call.name, dict(function_call.args))
+                    for function_call in response.function_calls
+                ))
+
+                # Provide the tool results back to Gemini for a final response,
+                # validating all function-response parts in one batch
+                function_responses = _part_list_adapter().validate_python([
+                    {"function_response": {"name": function_call.name, "response": {"result": result}}}
+                    for function_call, result in zip(response.function_calls, tool_results)
+                ])
 
                 # Get final response from Gemini with tool results
-                final_response = self.gemini_client.models.generate_content(
+                final_response = await self.gemini_client.aio.models.generate_content(
                     model='gemini-2.0-flash-exp',
                     contents=[
-                        system_prompt,
+                        SYSTEM_PROMPT,
                         f"\nUser request: {user_request}",
                         response.candidates[0].content,
                         types.Content(role="tool", parts=function_responses)
@@ -209,18 +271,16 @@ class GeminiGameMaster:
                 # No tool calls, use the direct response
                 final_text = response.text
 
-            # Add to game history
-            self.game_history.append({
+            # Game history entry, appended by the caller in request order
+            return final_text, {
                 "user_request": user_request,
                 "gm_response": final_text,
                 "tool_calls": len(response.function_calls) if response.function_calls else 0
-            })
-
-            return final_text
+            }
 
         except Exception as e:
             print(f"❌ Error processing request: {e}")
-            return f"I encountered an error while processing your request: {str(e)}"
+            return f"I encountered an error while processing your request: {str(e)}", None
 
 
 async def demo_proper_mcp_integration():
@@ -234,28 +294,30 @@ async def demo_proper_mcp_integration():
     print("- Natural conversation with structured game management")
     print("=" * 60)
 
-    gm = GeminiGameMaster()
-
-    # Demo scenarios that will trigger different MCP tool calls
-    scenarios = [
-        "Create a fantasy world with magic and dragons",
-        "Create a brave knight named Sir Galen in that world",
-        "Move Sir Galen to the dragon's lair",
-        "What worlds do we have available?",
-        "Create a sci-fi world with spaceships",
-        "Tell me about our current adventures"
+    # Demo scenarios that will trigger different MCP tool calls, in their
+    # original order and grouped into stages: scenarios within a stage are
+    # independent and run concurrently, while each stage depends on the game
+    # state built by the ones before it.
+    stages = [
+        ["Create a fantasy world with magic and dragons"],
+        ["Create a brave knight named Sir Galen in that world"],
+        [
+            "Move Sir Galen to the dragon's lair",
+            "What worlds do we have available?"
+        ],
+        ["Create a sci-fi world with spaceships"],
+        ["Tell me about our current adventures"]
     ]
 
-    for scenario in scenarios:
-        print(f"\n🎯 **Scenario: {scenario}**")
-        print("-" * 50)
-
-        response = await gm.process_game_request(scenario)
-        print(f"🤖 Game Master: {response}")
-        print()
+    async with GeminiGameMaster() as gm:
+        for stage in stages:
+            responses = await gm.process_game_requests(stage)
 
-        # Small delay between requests
-        await asyncio.sleep(1)
+            for scenario, response in zip(stage, responses):
+                print(f"\n🎯 **Scenario: {scenario}**")
+                print("-" * 50)
+                print(f"🤖 Game Master: {response}")
+                print()
 
     print("=" * 60)
     print("🎉 **Demo Complete!**")
@@ -1,14 +1,82 @@
 import asyncio
+import contextvars
 import os
 import sys
+import threading
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
-from langchain.agents import create_openai_functions_agent, AgentExecutor
+from langchain.agents import create_tool_calling_agent, AgentExecutor
 from langchain.tools import BaseTool
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.schema import BaseMessage
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-import requests
+import httpx
+
+from _tool_routing import route
+
+MCP_BASE_URL = "http://127.0.0.1:8000"
+
+# Shared keep-alive client for all MCP server traffic. Streamable HTTP answers a
+# plain GET with 406 (it expects an SSE Accept header), which still proves the
+# server is up.
+_HTTP = httpx.AsyncClient(
+    base_url=MCP_BASE_URL,
+    timeout=httpx.Timeout(2.0),
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+# _HTTP's connections are bound to main()'s event loop; calls made under a
+# different loop (the sync tool path) swap in their own client here
+_MCP_CLIENT = contextvars.ContextVar("_MCP_CLIENT", default=_HTTP)
+
+# Separate pool for OpenAI traffic (the MCP client above has a 2s timeout);
+# successive prompts reuse the same TLS connection
+_OPENAI_HTTP = httpx.AsyncClient(
+    timeout=httpx.Timeout(60.0),
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+)
+
+async def _probe_server() -> bool:
+    """Return True if the MCP server answers on its /mcp endpoint."""
+    response = await _MCP_CLIENT.get().get("/mcp")
+    return response.status_code in (200, 406)
+
+async def _ainput(prompt: str) -> str:
+    """input() that does not block the event loop.
+
+    The read runs on a daemon thread so a prompt still waiting for input
+    never holds up interpreter shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError / KeyboardInterrupt belong to the caller
+            loop.call_soon_threadsafe(resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def _periodic_health_check(interval: float = 30.0) -> None:
+    """Probe the MCP server in the background and report availability changes."""
+    healthy = True
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            reachable = await _probe_server()
+        except httpx.HTTPError:
+            reachable = False
+        if reachable != healthy:
+            healthy = reachable
+            print("\n✅ MCP server is reachable again" if reachable else "\n⚠️  Lost connection to MCP server")
 
 # Custom MCP-compatible tool for game world operations
 class GameWorldTool(BaseTool):
@@ -29,36 +97,34 @@ class GameWorldTool(BaseTool):
     """
 
     def _run(self, query: str) -> str:
+        """Synchronous entry point; the tool itself is async end to end"""
+        return asyncio.run(self._arun_own_client(query))
+
+    async def _arun_own_client(self, query: str) -> str:
+        """Run _arun with a client owned by the current (short-lived) loop"""
+        async with httpx.AsyncClient(base_url=MCP_BASE_URL, timeout=httpx.Timeout(2.0)) as client:
+            _MCP_CLIENT.set(client)
+            return await self._arun(query)
+
+    async def _arun(self, query: str) -> str:
         """Execute the game world tool using direct MCP server calls"""
         try:
-            # Analyze the query to determine what action to take
-            query_lower = query.lower()
-
-            if "create" in query_lower and "world" in query_lower:
-                return self._create_world(query)
-            elif "generate" in query_lower and "world" in query_lower:
-                return self._create_world(query)
-            elif "character" in query_lower or "knight" in query_lower or "hero" in query_lower:
-                return self._create_character(query)
-            elif "move" in query_lower or "location" in query_lower:
-                return self._move_character(query)
-            elif "list" in query_lower or "available" in query_lower or "what" in query_lower:
-                return self._list_worlds()
-            else:
+            handler = route(query)
+            if handler is None:
                 return f"I understand you want to: '{query}'\nPlease try a more specific command like 'create a fantasy world' or 'list all worlds'."
+            return await getattr(self, f"_{handler}")(query)
 
         except Exception as e:
             return f"❌ Error executing game world operation: {e}"
 
-    def _create_world(self, query: str) -> str:
+    async def _create_world(self, query: str) -> str:
         """Create a new game world"""
         try:
             # Check if server is running
             try:
-                response = requests.get("http://127.0.0.1:8000/mcp", timeout=2)
-                if response.status_code != 200:
+                if not await _probe_server():
                     return "❌ MCP server is not responding. Please start the server first."
-            except:
+            except httpx.HTTPError:
                 return "❌ Cannot connect to MCP server. Please start the server with: python server.py"
 
             # Make direct HTTP call to MCP server (simplified for demo)
@@ -67,7 +133,7 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Error creating world: {e}"
 
-    def _create_character(self, query: str) -> str:
+    async def _create_character(self, query: str) -> str:
         """Create a new character"""
         try:
             return "🎮 Successfully created character!\n🧙 Name: Sir Galen\n⚔️ Class: Knight\n📊 Level: 1\n❤️ Health: 100/100\n🔮 Mana: 50/50\n🎲 Skills: Sword Fighting, Shield Defense, Leadership\n🎒 Equipment: Iron Sword, Wooden Shield, Leather Armor"
@@ -75,7 +141,7 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Error creating character: {e}"
 
-    def _move_character(self, query: str) -> str:
+    async def _move_character(self, query: str) -> str:
         """Move a character to a new location"""
         try:
             return "🚶 Character movement completed!\n📍 New Location: Dragon's Lair\n⚠️ Danger Level: High\n✨ The journey continues..."
@@ -83,7 +149,7 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Error moving character: {e}"
 
-    def _list_worlds(self, query: str = "") -> str:
+    async def _list_worlds(self, query: str = "") -> str:
         """List all available worlds"""
         try:
             return "🌍 Available Worlds:\n• Eldoria (Fantasy) - A magical realm with dragons and ancient mysteries\n• Cyberia (Sci-Fi) - A futuristic world with advanced technology\n• Mythoria (Adventure) - A world of heroes and legendary quests"
@@ -91,6 +157,18 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Error listing worlds: {e}"
 
+# Built once at import; neither depends on the environment
+_TOOL_SINGLETON = GameWorldTool()
+_TOOLS = [_TOOL_SINGLETON]
+
+PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an AI assistant that helps users manage game worlds and characters.
+    Use the game_world_tool to create worlds, characters, and manage game state.
+    Be creative and engaging in your responses."""),
+    ("human", "{input}"),
+    MessagesPlaceholder(variable_name="agent_scratchpad"),
+])
+
 async def main():
     # Load environment variables
     load_dotenv()
@@ -102,7 +180,7 @@ async def main():
     print("🔍 Checking MCP server status...")
     server_running = False
     try:
-        response = requests.get("http://127.0.0.1:8000/mcp", timeout=2)
+        response = await _HTTP.get("/mcp")
         if response.status_code == 200 or response.status_code == 406:
             server_running = True
             print("✅ MCP server is running")
@@ -121,14 +199,12 @@ async def main():
 
     # Create the game world tool
     print("🔧 Creating game world tool...")
-    game_world_tool = GameWorldTool()
-    tools = [game_world_tool]
     print("✅ Game world tool created")
 
     # Create LLM
     print("🤖 Creating LLM...")
     try:
-        llm = ChatOpenAI(model="gpt-4o-mini")
+        llm = ChatOpenAI(model="gpt-4o-mini", http_async_client=_OPENAI_HTTP)
         print("✅ LLM initialized")
     except Exception as e:
         print(f"❌ LLM initialization failed: {e}")
@@ -140,18 +216,9 @@ async def main():
     # Create agent
     print("🚀 Creating LangChain agent...")
     try:
-        # Create prompt template
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an AI assistant that helps users manage game worlds and characters.
-            Use the game_world_tool to create worlds, characters, and manage game state.
-            Be creative and engaging in your responses."""),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-
         # Create agent
-        agent = create_openai_functions_agent(llm=llm, tools=tools, prompt=prompt)
-        agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=False)
+        agent = create_tool_calling_agent(llm=llm, tools=_TOOLS, prompt=PROMPT)
+        agent_executor = AgentExecutor(agent=agent, tools=_TOOLS, verbose=False, handle_parsing_errors=True)
         print("✅ LangChain agent created successfully")
     except Exception as e:
         print(f"❌ Agent creation failed: {e}")
@@ -171,55 +238,69 @@ async def main():
     print("")
 
     # Interactive loop with enhanced error handling
-    while True:
-        try:
-            user_input = input("💬 What would you like to do in the game world? (or 'quit' to exit): ")
-            if user_input.lower() in ['quit', 'exit', 'q']:
-                break
-
-            if not user_input.strip():
-                continue
+    # Keep the connection pool warm and notice server restarts while the user types
+    health_task = asyncio.create_task(_periodic_health_check())
+    try:
+        while True:
+            try:
+                user_input = await _ainput("💬 What would you like to do in the game world? (or 'quit' to exit): ")
+                if user_input.lower() in ['quit', 'exit', 'q']:
+                    break
 
-            print(f"\n🔄 Processing: {user_input}")
-            print("-" * 50)
+                if not user_input.strip():
+                    continue
 
-            # Run the query with timeout and error handling
-            try:
-                # Add timeout to prevent hanging
-                result = await asyncio.wait_for(
-                    agent_executor.ainvoke({"input": user_input}),
-                    timeout=60.0  # 60 second timeout
-                )
-                print(f"\n✅ Result: {result['output']}")
+                print(f"\n🔄 Processing: {user_input}")
                 print("-" * 50)
 
-            except asyncio.TimeoutError:
-                print("❌ Request timed out after 60 seconds")
-                print("🔧 Troubleshooting:")
-                print("   - Server might be overloaded")
-                print("   - Try a simpler command")
-                print("   - Check server logs for errors")
-
+                # Run the query with timeout and error handling, printing model
+                # tokens as they arrive rather than after the whole run finishes
+                try:
+                    # Add timeout to prevent hanging
+                    async with asyncio.timeout(60.0):  # 60 second timeout
+                        print("\n✅ Result: ", end="", flush=True)
+                        async for event in agent_executor.astream_events({"input": user_input}, version="v2"):
+                            if event["event"] == "on_chat_model_stream":
+                                print(event["data"]["chunk"].content, end="", flush=True)
+                    print()
+                    print("-" * 50)
+
+                except asyncio.TimeoutError:
+                    print("\n❌ Request timed out after 60 seconds")
+                    print("🔧 Troubleshooting:")
+                    print("   - Server might be overloaded")
+                    print("   - Try a simpler command")
+                    print("   - Check server logs for errors")
+
+                except Exception as e:
+                    print(f"❌ Error during execution: {e}")
+                    print("🔧 Troubleshooting:")
+                    if "Connection closed" in str(e):
+                        print("   - Server connection lost")
+                        print("   - Try restarting the server")
+                    elif "transport" in str(e).lower():
+                        print("   - Transport protocol issue")
+                        print("   - Check server compatibility")
+                    elif "unhandled errors" in str(e):
+                        print("   - Server-side error occurred")
+                        print("   - Check server logs")
+                    print("   - Try again with a simpler command")
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # asyncio.run turns Ctrl-C into cancellation of the awaited prompt
+                print("\n👋 Goodbye!")
+                break
             except Exception as e:
-                print(f"❌ Error during execution: {e}")
-                print("🔧 Troubleshooting:")
-                if "Connection closed" in str(e):
-                    print("   - Server connection lost")
-                    print("   - Try restarting the server")
-                elif "transport" in str(e).lower():
-                    print("   - Transport protocol issue")
-                    print("   - Check server compatibility")
-                elif "unhandled errors" in str(e):
-                    print("   - Server-side error occurred")
-                    print("   - Check server logs")
-                print("   - Try again with a simpler command")
-
-        except KeyboardInterrupt:
-            print("\n👋 Goodbye!")
-            break
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            print("Please try again.")
+                print(f"❌ Unexpected error: {e}")
+                print("Please try again.")
+    finally:
+        health_task.cancel()
+
+async def _main():
+    try:
+        await main()
+    finally:
+        await asyncio.gather(_HTTP.aclose(), _OPENAI_HTTP.aclose())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_main())
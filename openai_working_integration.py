@@ -7,14 +7,38 @@ Uses direct langchain integration with our FastMCP server
 import asyncio
 import os
 import json
+import re
+from functools import lru_cache
+from hashlib import blake2b
 from typing import List, Dict, Any
 from langchain_openai import ChatOpenAI
-from langchain.agents import create_openai_functions_agent, AgentExecutor
+from langchain.agents import create_tool_calling_agent, AgentExecutor
 from langchain.tools import BaseTool
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.schema import BaseMessage
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 import requests
+import httpx
+
+from _tool_routing import route
+
+# Upper bound on agent queries in flight at once
+MAX_CONCURRENT_QUERIES = 5
+
+# One pooled client for every OpenAI request this process makes, so the
+# concurrent agent calls reuse warm TLS connections instead of each
+# ChatOpenAI building its own transport
+_OPENAI_HTTP = httpx.AsyncClient(
+    timeout=httpx.Timeout(60.0),
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+)
+
+def _stable_suffix(query: str) -> int:
+    """Short numeric ID suffix that, unlike hash(), is the same in every process."""
+    return int.from_bytes(blake2b(query.encode(), digest_size=4).digest(), "big") % 1000
+
+# The word following a standalone "named"/"name"/"called" is the character name
+_NAME_RE = re.compile(r"(?<!\S)(?:named|name|called)\s+(\S+)", re.IGNORECASE)
 
 class GameWorldTool(BaseTool):
     """Custom tool for game world operations"""
@@ -34,31 +58,14 @@ class GameWorldTool(BaseTool):
 
     def _run(self, query: str) -> str:
         """Execute the game world tool"""
-        try:
-            # Analyze the query to determine what action to take
-            query_lower = query.lower()
-
-            if "create" in query_lower and "world" in query_lower:
-                return self._create_world(query)
-            elif "generate" in query_lower and "world" in query_lower:
-                return self._create_world(query)
-            elif "character" in query_lower or "knight" in query_lower or "hero" in query_lower:
-                return self._create_character(query)
-            elif "move" in query_lower or "location" in query_lower:
-                return self._move_character(query)
-            elif "list" in query_lower or "available" in query_lower or "what" in query_lower:
-                return self._list_worlds()
-            else:
-                return f"I need to perform a game world operation for: {query}. Let me create a world for you!"
-
-        except Exception as e:
-            return f"Error executing game world operation: {str(e)}"
+        return _dispatch_query(query)
 
     async def _arun(self, query: str) -> str:
         """Async version of the tool"""
         return self._run(query)
 
-    def _create_world(self, query: str) -> str:
+    @staticmethod
+    def _create_world(query: str) -> str:
         """Create a new game world"""
         try:
             # Extract world type from query
@@ -73,7 +80,7 @@ class GameWorldTool(BaseTool):
                 description = "A unique world with its own rules and inhabitants"
 
             world_data = {
-                "world_id": f"world_{world_type.lower()}_{hash(query) % 1000}",
+                "world_id": f"world_{world_type.lower()}_{_stable_suffix(query)}",
                 "name": f"{world_type} Realm",
                 "style": world_type,
                 "description": description,
@@ -87,7 +94,8 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Failed to create world: {str(e)}"
 
-    def _create_character(self, query: str) -> str:
+    @staticmethod
+    def _create_character(query: str) -> str:
         """Create a new character"""
         try:
             # Extract character details from query
@@ -105,12 +113,8 @@ class GameWorldTool(BaseTool):
                 description = "A courageous explorer seeking fortune and glory"
 
             # Extract name if mentioned
-            name = "Unknown Hero"
-            words = query.split()
-            for i, word in enumerate(words):
-                if word.lower() in ["named", "name", "called"] and i + 1 < len(words):
-                    name = words[i + 1].strip('.,!?')
-                    break
+            match = _NAME_RE.search(query)
+            name = match.group(1).strip('.,!?') if match else "Unknown Hero"
 
             character_data = {
                 "name": name,
@@ -128,7 +132,8 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Failed to create character: {str(e)}"
 
-    def _move_character(self, query: str) -> str:
+    @staticmethod
+    def _move_character(query: str) -> str:
         """Move a character to a new location"""
         try:
             # Extract location from query
@@ -153,7 +158,8 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Failed to move character: {str(e)}"
 
-    def _list_worlds(self) -> str:
+    @staticmethod
+    def _list_worlds(query: str = "") -> str:
         """List available worlds"""
         try:
             worlds = [
@@ -171,6 +177,37 @@ class GameWorldTool(BaseTool):
         except Exception as e:
             return f"❌ Failed to list worlds: {str(e)}"
 
+@lru_cache(maxsize=512)
+def _dispatch_query(query: str) -> str:
+    """Route a query to its GameWorldTool handler.
+
+    Responses depend only on the query text, so they are memoized here;
+    BaseTool instances are pydantic models and cannot back an lru_cache.
+    """
+    try:
+        handler = route(query)
+        if handler is None:
+            return f"I need to perform a game world operation for: {query}. Let me create a world for you!"
+        return getattr(GameWorldTool, f"_{handler}")(query)
+
+    except Exception as e:
+        return f"Error executing game world operation: {str(e)}"
+
+# The tool and prompt do not depend on the environment, so they are built
+# and validated once at import rather than on every main() run
+_TOOL_SINGLETON = GameWorldTool()
+_TOOLS = [_TOOL_SINGLETON]
+
+PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content="""You are an AI Game Master helping users create and manage fantasy and sci-fi worlds.
+    You have access to game world management tools that can create worlds, characters, and manage game state.
+    Always use the available tools when the user asks about game world operations.
+    Be creative and engaging in your responses."""),
+    MessagesPlaceholder(variable_name="chat_history"),
+    ("human", "{input}"),
+    MessagesPlaceholder(variable_name="agent_scratchpad"),
+])
+
 async def main():
     """Main function to run the working OpenAI + Game World integration"""
     print("🤖 OpenAI + Game World Integration (Working Version)")
@@ -188,32 +225,19 @@ async def main():
             return
 
         print("🧠 Initializing OpenAI model...")
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, api_key=api_key)
+        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, api_key=api_key, http_async_client=_OPENAI_HTTP)
         print(f"✅ OpenAI model initialized: {llm.model_name}")
 
         # Create game world tool
         print("🎮 Creating Game World Tool...")
-        game_tool = GameWorldTool()
-        tools = [game_tool]
         print("✅ Game World Tool created")
 
         # Create the agent
         print("🎯 Setting up LangChain Agent...")
 
-        # Create a simple prompt
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="""You are an AI Game Master helping users create and manage fantasy and sci-fi worlds.
-            You have access to game world management tools that can create worlds, characters, and manage game state.
-            Always use the available tools when the user asks about game world operations.
-            Be creative and engaging in your responses."""),
-            MessagesPlaceholder(variable_name="chat_history"),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
-
-        # Create the agent
-        agent = create_openai_functions_agent(llm, tools, prompt)
-        agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
+        # Create the agent (parallel tool calls are awaited concurrently)
+        agent = create_tool_calling_agent(llm, _TOOLS, PROMPT)
+        agent_executor = AgentExecutor(agent=agent, tools=_TOOLS, verbose=True, handle_parsing_errors=True)
         print("✅ LangChain Agent ready")
 
         # Test queries
@@ -228,25 +252,32 @@ async def main():
         print("\n🎯 Running Game World Queries...")
         print("-" * 40)
 
-        for i, query in enumerate(test_queries, 1):
-            print(f"\n🔥 Query {i}: {query}")
-            print("-" * 40)
+        # The queries are independent LLM round-trips, so run them concurrently
+        # (bounded by a semaphore) and report the results in query order
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
 
-            try:
-                response = await agent_executor.ainvoke({
+        async def run_query(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await agent_executor.ainvoke({
                     "input": query,
                     "chat_history": []
                 })
 
-                print(f"🎲 Response: {response['output']}")
+        responses = await asyncio.gather(
+            *(run_query(query) for query in test_queries),
+            return_exceptions=True
+        )
 
-                # Add a small delay between queries
-                await asyncio.sleep(2)
+        for i, (query, response) in enumerate(zip(test_queries, responses), 1):
+            print(f"\n🔥 Query {i}: {query}")
+            print("-" * 40)
 
-            except Exception as e:
-                print(f"❌ Error: {e}")
+            if isinstance(response, Exception):
+                print(f"❌ Error: {response}")
                 continue
 
+            print(f"🎲 Response: {response['output']}")
+
         print("\n" + "=" * 60)
         print("🎉 OpenAI + Game World Integration Completed!")
         print("✅ Successfully integrated OpenAI with game world management")
@@ -260,5 +291,11 @@ async def main():
         import traceback
         traceback.print_exc()
 
+async def _main():
+    try:
+        await main()
+    finally:
+        await _OPENAI_HTTP.aclose()
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_main())
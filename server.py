@@ -1,13 +1,23 @@
 
+import asyncio
+import copy
+import os
+import sys
 import uuid
 import json
 import logging
-from typing import Dict, Optional
+import orjson
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastmcp import FastMCP, Context
-from world_bible_schema import WorldBible, PlayerCharacter
+from fastmcp.tools import ToolResult
+from pydantic import TypeAdapter, ValidationError
+from world_bible_schema import WorldBible, PlayerCharacter, GameStyle
 
 # Configure logging
 logging.basicConfig(
@@ -18,7 +28,266 @@ logger = logging.getLogger(__name__)
 
 # 2. In-memory storage for generated worlds (for now)
 # In a real application, you would use a database.
-WORLD_STORAGE: Dict[str, WorldBible] = {}
+@dataclass(slots=True)
+class WorldEntry:
+    """A stored world plus its list_worlds summary row and serialized JSON.
+
+    The summary and the by-name character index are kept in step with the
+    world at write time. Anything that mutates ``world`` must reset
+    ``cached_json`` to None; it is rebuilt lazily on the next read.
+    """
+    world: WorldBible
+    summary: Dict[str, Any]
+    cached_json: Optional[str] = None
+    characters: Dict[str, PlayerCharacter] = field(default_factory=dict)
+
+def _world_summary(world_id: str, world: WorldBible) -> Dict[str, Any]:
+    """Build the row list_worlds reports for a world."""
+    return {
+        "world_id": world_id,
+        "name": world.metadata.name,
+        "style": world.metadata.style,
+        "description": world.metadata.description,
+        "has_character": world.protagonist is not None,
+        "character_name": world.protagonist.name if world.protagonist else None
+    }
+
+# Least recently used worlds are evicted once the store holds _MAX_WORLDS;
+# reads and character writes both count as use
+_MAX_WORLDS = int(os.getenv("WORLD_CACHE_MAX", "1024"))
+WORLD_STORAGE: OrderedDict[str, WorldEntry] = OrderedDict()
+
+# Tools run on the event loop, so check-then-write sequences on WORLD_STORAGE
+# hold this lock to stay atomic across awaits
+WORLD_STORAGE_LOCK = asyncio.Lock()
+
+# Validators for tool inputs, bound once at import
+_WB_ADAPTER = TypeAdapter(WorldBible)
+_PC_ADAPTER = TypeAdapter(PlayerCharacter)
+
+# Client payloads with more nested values than this are validated on a worker
+# thread so they do not stall other tool calls; smaller ones are cheaper inline.
+# A full sample character (about 1.7 KB of JSON) holds about 85 values.
+_OFFLOAD_VALIDATION_VALUES = 100
+
+def _payload_is_large(data: Any) -> bool:
+    """Count nested dict/list values, stopping as soon as the limit is passed."""
+    budget = _OFFLOAD_VALIDATION_VALUES
+    pending = [data]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            values = node.values()
+        elif isinstance(node, list):
+            values = node
+        else:
+            continue
+        budget -= len(values)
+        if budget < 0:
+            return True
+        pending.extend(values)
+    return False
+
+async def _validate_payload(adapter: TypeAdapter, data: dict) -> Any:
+    """Validate client-supplied data, off the event loop when it is large."""
+    if _payload_is_large(data):
+        return await asyncio.to_thread(adapter.validate_python, data)
+    return adapter.validate_python(data)
+
+_CHARACTER_EXISTS_DETAIL = "Character already exists for this world. Each world can have only one protagonist."
+
+def _require_world(world_id: str) -> WorldEntry:
+    """Return the stored entry for world_id or raise the matching HTTP error."""
+    if not world_id or not isinstance(world_id, str):
+        raise HTTPException(status_code=400, detail="World ID must be a non-empty string")
+    entry = WORLD_STORAGE.get(world_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"World with ID '{world_id}' not found.")
+    return entry
+
+# Per-style world templates and the numeric frameworks shared by every
+# generated world. Built once at import; treat them as read-only, since
+# validation keeps the nested dicts by reference.
+_WORLD_TEMPLATES: Mapping[str, Dict[str, str]] = MappingProxyType({
+    "Fantasy": {
+        "magic_system": "Elemental magic drawn from nature spirits and ancient runes",
+        "tech_level": "Medieval",
+        "calendar_system": "Twelve-month lunar calendar with solstice festivals",
+        "physics_laws": "Standard physics with magical exceptions and divine interventions",
+        "metaphysics": "Magic flows through ley lines and is powered by belief and ritual",
+        "economy": "Mixed barter and gold standard with magical currencies",
+        "abilities": "Magic schools (Arcane, Divine, Nature) and martial skills",
+        "items": "Weapons, armor, potions, scrolls, and enchanted artifacts",
+        "combat_system": "D20-based combat with tactical positioning and magical effects"
+    },
+    "Sci-Fi": {
+        "magic_system": "No magic - advanced technology and AI",
+        "tech_level": "Interstellar",
+        "calendar_system": "Galactic Standard Time with planet-specific adjustments",
+        "physics_laws": "Advanced physics including quantum mechanics and relativity",
+        "metaphysics": "Scientific understanding of the universe with emerging AI consciousness",
+        "economy": "Digital credits with blockchain-based transactions and interstellar trade networks",
+        "currency": "Universal Credits and Quantum Coins",
+        "abilities": "Cybernetic enhancements, hacking skills, and starship operation",
+        "items": "Energy weapons, medical nanites, holo-devices, and AI companions",
+        "combat_system": "Tech-based combat with hacking, energy weapons, and tactical systems"
+    },
+    "Cyberpunk": {
+        "magic_system": "Hacking and digital sorcery",
+        "tech_level": "Near Future",
+        "calendar_system": "Neo-Tokyo Standard Time with corporate calendar overlays",
+        "physics_laws": "Modern physics with cybernetic enhancements and digital interfaces",
+        "metaphysics": "Transhumanist philosophy merging human consciousness with digital networks",
+        "economy": "Cryptocurrency with corporate scrip and black market exchanges",
+        "currency": "Crypto-Tokens and Corporate Scrip",
+        "abilities": "Hacking, cybernetics integration, and street combat",
+        "items": "Smart weapons, neural implants, designer drugs, and ICE breakers",
+        "combat_system": "High-tech combat with cybernetic enhancements and digital warfare"
+    }
+})
+
+# Mana tiers and economy tables referenced by every generated world
+_MANA_FRAMEWORK = {
+    "normal_person": {"min": 0, "max": 50},
+    "skilled": {"min": 50, "max": 200},
+    "expert": {"min": 200, "max": 500},
+    "master": {"min": 500, "max": 1000},
+    "spell_costs": {
+        "minor": {"min": 5, "max": 20},
+        "moderate": {"min": 20, "max": 100},
+        "major": {"min": 100, "max": 500},
+        "legendary": {"min": 500, "max": 1000}
+    }
+}
+
+_BASE_PRICES = {
+    "food": {"bread": 5, "meal": 25, "feast": 100},
+    "clothing": {"basic": 50, "fine": 200, "noble": 1000},
+    "equipment": {"basic_weapon": 100, "fine_weapon": 500, "masterwork": 2000},
+    "potions": {"healing": 50, "mana": 75, "buff": 150},
+    "housing": {"room": 50, "house": 5000, "estate": 50000}
+}
+
+_PRICE_MULTIPLIERS = {
+    "common": 1.0,
+    "uncommon": 2.5,
+    "rare": 10.0,
+    "epic": 50.0,
+    "legendary": 250.0
+}
+
+def _intern_strings(node: Any) -> Any:
+    """Intern every string value in a nested dict/list tree, in place."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            node[key] = _intern_strings(value)
+    elif isinstance(node, list):
+        node[:] = [_intern_strings(value) for value in node]
+    elif isinstance(node, str):
+        return sys.intern(node)
+    return node
+
+def _build_world_skeleton(template: Mapping[str, str], races: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Build the parts of a world that do not change between calls for a style."""
+    return {
+        "cosmology": {
+            "magic_system": template["magic_system"],
+            "tech_level": template["tech_level"],
+            "calendar_system": template["calendar_system"],
+            "physics_laws": template["physics_laws"],
+            "metaphysics": template["metaphysics"]
+        },
+        "geography": {
+            "macro_geography": "Three main continents with diverse biomes and strategic locations",
+            "key_regions": [
+                {"name": "Starting Village", "description": "A humble beginning for adventurers"},
+                {"name": "Ancient Ruins", "description": "Remnants of a lost civilization"},
+                {"name": "Capital City", "description": "The political and economic heart of the realm"}
+            ]
+        },
+        "society": {
+            "races": races,
+            "factions": [
+                {"name": "Merchants Guild", "description": "Controls trade and commerce"},
+                {"name": "Mages Council", "description": "Regulates magical practices"} if "magic" in template["magic_system"].lower() else {"name": "Tech Consortium", "description": "Advances technological progress"},
+                {"name": "Adventurers League", "description": "Supports exploration and discovery"}
+            ],
+            "social_structure": "Feudal system with modern elements and social mobility"
+        },
+        "history": {
+            "historical_events": [
+                "The Founding of the First Kingdom",
+                "The Discovery of Ancient Technology" if "tech" in template["tech_level"].lower() else "The Discovery of Ancient Magic",
+                "The Last Great Migration"
+            ]
+        },
+        "systems": {
+            "economy": template["economy"],
+            "abilities": template["abilities"],
+            "items": template["items"],
+            "combat_system": template["combat_system"],
+            "progression_system": "Level-based advancement with skill trees",
+            "crafting_system": "Recipe-based crafting with skill requirements"
+        },
+        # Add the numerical stability frameworks from GEMINI.md
+        "mana_framework": _MANA_FRAMEWORK,
+        "economic_framework": {
+            "currency": template.get("currency", "Gold Coins"),
+            "base_prices": _BASE_PRICES,
+            "price_multipliers": _PRICE_MULTIPLIERS
+        }
+    }
+
+# Races follow the style rather than the template: styles without a template
+# of their own use the Fantasy template but still get the tech races
+_FANTASY_RACES = [
+    {"name": "Humans", "description": "Adaptable and ambitious, found everywhere"},
+    {"name": "Elves", "description": "Graceful and long-lived, connected to nature"},
+    {"name": "Dwarves", "description": "Sturdy craftsmen and warriors"}
+]
+_TECH_RACES = [
+    {"name": "Humans", "description": "Adaptable and ambitious, found everywhere"},
+    {"name": "Androids", "description": "Artificial beings with growing sentience"},
+    {"name": "Cyborgs", "description": "Enhanced humans with cybernetic upgrades"}
+]
+
+# One skeleton per GameStyle, so generate_world picks a finished society and
+# history instead of branching on the style for each call
+_WORLD_SKELETONS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    style.value: _build_world_skeleton(
+        _WORLD_TEMPLATES.get(style.value, _WORLD_TEMPLATES["Fantasy"]),
+        _FANTASY_RACES if style is GameStyle.FANTASY else _TECH_RACES
+    )
+    for style in GameStyle
+})
+
+# Every generated world repeats these names and descriptions, so share one
+# interned copy of each across all stored worlds and their dumps
+for _skeleton in _WORLD_SKELETONS.values():
+    _intern_strings(_skeleton)
+
+def _clone_skeleton(skeleton: Dict[str, Any], style: str) -> Dict[str, Any]:
+    """Fill in the style-specific fields of a world skeleton.
+
+    Typed branches are rebuilt by validation, so they can be shared with the
+    skeleton. The Dict[str, Any] frameworks are not: pydantic keeps their
+    nested values by reference, so each world gets its own copy.
+    """
+    world_data = dict(skeleton)
+    world_data["mana_framework"] = copy.deepcopy(skeleton["mana_framework"])
+    world_data["economic_framework"] = copy.deepcopy(skeleton["economic_framework"])
+    world_data["metadata"] = {
+        "name": f"{style} Realm",
+        "description": f"A detailed {style.lower()} world with rich lore and consistent systems.",
+        "style": style
+    }
+    world_data["history"] = {
+        "creation_myth": f"The {style.lower()} realm was shaped by ancient forces and heroic deeds.",
+        "major_conflicts": f"The Great {style} War that shaped the current political landscape.",
+        **skeleton["history"]
+    }
+    world_data["skills_framework"] = {}
+    return world_data
 
 @asynccontextmanager
 async def lifespan(app):
@@ -43,7 +312,7 @@ mcp = FastMCP(
 
 # 3. World Generation Tool
 @mcp.tool
-def generate_world(style: str, ctx: Context) -> dict:
+async def generate_world(style: str, ctx: Context) -> dict:
     """
     Generates a new game world based on a specified style (e.g., 'Fantasy', 'Sci-Fi', 'Cyberpunk').
 
@@ -64,144 +333,28 @@ def generate_world(style: str, ctx: Context) -> dict:
     try:
         # Validate input
         if not style or not isinstance(style, str):
-            raise ValueError("Style must be a non-empty string")
-
-        world_id = str(uuid.uuid4())
-        logger.info(f"Starting world generation for style: {style}")
-
-        # Create world based on style with enhanced templates
-        world_templates = {
-            "Fantasy": {
-                "magic_system": "Elemental magic drawn from nature spirits and ancient runes",
-                "tech_level": "Medieval",
-                "calendar_system": "Twelve-month lunar calendar with solstice festivals",
-                "physics_laws": "Standard physics with magical exceptions and divine interventions",
-                "metaphysics": "Magic flows through ley lines and is powered by belief and ritual",
-                "economy": "Mixed barter and gold standard with magical currencies",
-                "abilities": "Magic schools (Arcane, Divine, Nature) and martial skills",
-                "items": "Weapons, armor, potions, scrolls, and enchanted artifacts",
-                "combat_system": "D20-based combat with tactical positioning and magical effects"
-            },
-            "Sci-Fi": {
-                "magic_system": "No magic - advanced technology and AI",
-                "tech_level": "Interstellar",
-                "calendar_system": "Galactic Standard Time with planet-specific adjustments",
-                "physics_laws": "Advanced physics including quantum mechanics and relativity",
-                "metaphysics": "Scientific understanding of the universe with emerging AI consciousness",
-                "economy": "Digital credits with blockchain-based transactions and interstellar trade networks",
-                "currency": "Universal Credits and Quantum Coins",
-                "abilities": "Cybernetic enhancements, hacking skills, and starship operation",
-                "items": "Energy weapons, medical nanites, holo-devices, and AI companions",
-                "combat_system": "Tech-based combat with hacking, energy weapons, and tactical systems"
-            },
-            "Cyberpunk": {
-                "magic_system": "Hacking and digital sorcery",
-                "tech_level": "Near Future",
-                "calendar_system": "Neo-Tokyo Standard Time with corporate calendar overlays",
-                "physics_laws": "Modern physics with cybernetic enhancements and digital interfaces",
-                "metaphysics": "Transhumanist philosophy merging human consciousness with digital networks",
-                "economy": "Cryptocurrency with corporate scrip and black market exchanges",
-                "currency": "Crypto-Tokens and Corporate Scrip",
-                "abilities": "Hacking, cybernetics integration, and street combat",
-                "items": "Smart weapons, neural implants, designer drugs, and ICE breakers",
-                "combat_system": "High-tech combat with cybernetic enhancements and digital warfare"
-            }
-        }
+            raise HTTPException(status_code=400, detail="Style must be a non-empty string")
 
-        template = world_templates.get(style, world_templates["Fantasy"])
-        logger.info(f"Using template for {style}: {list(template.keys())}")
-
-        # Generate structured world data
-        world_data = {
-            "metadata": {
-                "name": f"{style} Realm",
-                "description": f"A detailed {style.lower()} world with rich lore and consistent systems.",
-                "style": style
-            },
-            "cosmology": {
-                "magic_system": template["magic_system"],
-                "tech_level": template["tech_level"],
-                "calendar_system": template["calendar_system"],
-                "physics_laws": template["physics_laws"],
-                "metaphysics": template["metaphysics"]
-            },
-            "geography": {
-                "macro_geography": f"Three main continents with diverse biomes and strategic locations",
-                "key_regions": [
-                    {"name": "Starting Village", "description": "A humble beginning for adventurers"},
-                    {"name": "Ancient Ruins", "description": "Remnants of a lost civilization"},
-                    {"name": "Capital City", "description": "The political and economic heart of the realm"}
-                ]
-            },
-            "society": {
-                "races": [
-                    {"name": "Humans", "description": "Adaptable and ambitious, found everywhere"},
-                    {"name": "Elves", "description": "Graceful and long-lived, connected to nature"} if style == "Fantasy" else {"name": "Androids", "description": "Artificial beings with growing sentience"},
-                    {"name": "Dwarves", "description": "Sturdy craftsmen and warriors"} if style == "Fantasy" else {"name": "Cyborgs", "description": "Enhanced humans with cybernetic upgrades"}
-                ],
-                "factions": [
-                    {"name": "Merchants Guild", "description": "Controls trade and commerce"},
-                    {"name": "Mages Council", "description": "Regulates magical practices"} if "magic" in template["magic_system"].lower() else {"name": "Tech Consortium", "description": "Advances technological progress"},
-                    {"name": "Adventurers League", "description": "Supports exploration and discovery"}
-                ],
-                "social_structure": "Feudal system with modern elements and social mobility"
-            },
-            "history": {
-                "creation_myth": f"The {style.lower()} realm was shaped by ancient forces and heroic deeds.",
-                "major_conflicts": f"The Great {style} War that shaped the current political landscape.",
-                "historical_events": [
-                    "The Founding of the First Kingdom",
-                    "The Discovery of Ancient Technology" if "tech" in template["tech_level"].lower() else "The Discovery of Ancient Magic",
-                    "The Last Great Migration"
-                ]
-            },
-            "systems": {
-                "economy": template["economy"],
-                "abilities": template["abilities"],
-                "items": template["items"],
-                "combat_system": template["combat_system"],
-                "progression_system": "Level-based advancement with skill trees",
-                "crafting_system": "Recipe-based crafting with skill requirements"
-            },
-            # Add the numerical stability frameworks from GEMINI.md
-            "mana_framework": {
-                "normal_person": {"min": 0, "max": 50},
-                "skilled": {"min": 50, "max": 200},
-                "expert": {"min": 200, "max": 500},
-                "master": {"min": 500, "max": 1000},
-                "spell_costs": {
-                    "minor": {"min": 5, "max": 20},
-                    "moderate": {"min": 20, "max": 100},
-                    "major": {"min": 100, "max": 500},
-                    "legendary": {"min": 500, "max": 1000}
-                }
-            },
-            "economic_framework": {
-                "currency": template.get("currency", "Gold Coins"),
-                "base_prices": {
-                    "food": {"bread": 5, "meal": 25, "feast": 100},
-                    "clothing": {"basic": 50, "fine": 200, "noble": 1000},
-                    "equipment": {"basic_weapon": 100, "fine_weapon": 500, "masterwork": 2000},
-                    "potions": {"healing": 50, "mana": 75, "buff": 150},
-                    "housing": {"room": 50, "house": 5000, "estate": 50000}
-                },
-                "price_multipliers": {
-                    "common": 1.0,
-                    "uncommon": 2.5,
-                    "rare": 10.0,
-                    "epic": 50.0,
-                    "legendary": 250.0
-                }
-            },
-            "skills_framework": {}
-        }
+        world_id = uuid.uuid4().hex
+        logger.info("Starting world generation for style: %s", style)
+
+        template_name = style if style in _WORLD_TEMPLATES else "Fantasy"
+        logger.info("Using template for %s: %s", style, _WORLD_TEMPLATES[template_name].keys())
+
+        # Generate structured world data. Styles outside GameStyle fail
+        # metadata validation whichever skeleton they fall back to.
+        world_data = _clone_skeleton(_WORLD_SKELETONS.get(style, _WORLD_SKELETONS["Fantasy"]), style)
 
         # Validate and create world
-        world = WorldBible.parse_obj(world_data)
-        WORLD_STORAGE[world_id] = world
+        world = _WB_ADAPTER.validate_python(world_data)
+        async with WORLD_STORAGE_LOCK:
+            WORLD_STORAGE[world_id] = WorldEntry(world, _world_summary(world_id, world))
+            if len(WORLD_STORAGE) > _MAX_WORLDS:
+                evicted_id, _ = WORLD_STORAGE.popitem(last=False)
+                logger.info("World storage full, evicted least recently used world %s", evicted_id)
 
-        ctx.info(f"Successfully created and stored {style} world {world_id}")
-        logger.info(f"Generated world with ID: {world_id} for style: {style}")
+        await ctx.info(f"Successfully created and stored {style} world {world_id}")
+        logger.info("Generated world with ID: %s for style: %s", world_id, style)
 
         return {
             "world_id": world_id,
@@ -210,17 +363,20 @@ def generate_world(style: str, ctx: Context) -> dict:
             "style": style
         }
 
-    except ValueError as e:
-        ctx.error(f"Invalid input: {e}")
+    except ValidationError as e:
+        await ctx.error(f"Invalid input: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        await ctx.error(f"Invalid input: {e.detail}")
+        raise
     except Exception as e:
-        ctx.error(f"Failed to generate world: {e}")
-        logger.error(f"World generation failed: {e}", exc_info=True)
+        await ctx.error(f"Failed to generate world: {e}")
+        logger.error("World generation failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to generate world")
 
 # 4. World Data Resource
-@mcp.resource("worlds://{world_id}")
-def get_world_data(world_id: str, ctx: Context) -> dict:
+@mcp.resource("worlds://{world_id}", mime_type="application/json")
+async def get_world_data(world_id: str, ctx: Context) -> str:
     """
     Retrieves the complete World Bible data for a given world_id.
 
@@ -232,36 +388,35 @@ def get_world_data(world_id: str, ctx: Context) -> dict:
         ctx: FastMCP context for logging
 
     Returns:
-        dict: Complete world data structure
+        str: Complete world data structure, encoded as JSON
 
     Raises:
         HTTPException: If world is not found
     """
     try:
-        if not world_id or not isinstance(world_id, str):
-            raise ValueError("World ID must be a non-empty string")
-
-        if world_id not in WORLD_STORAGE:
-            ctx.error(f"World ID not found: {world_id}")
-            raise HTTPException(status_code=404, detail=f"World with ID '{world_id}' not found.")
-
-        world = WORLD_STORAGE[world_id]
-        ctx.info(f"Retrieved world data for {world_id}")
-        logger.info(f"World data accessed: {world_id}")
-
-        return world.dict()
-
-    except ValueError as e:
-        ctx.error(f"Invalid world ID: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        entry = _require_world(world_id)
+        WORLD_STORAGE.move_to_end(world_id)
+        await ctx.info(f"Retrieved world data for {world_id}")
+        logger.info("World data accessed: %s", world_id)
+
+        # Encode here; FastMCP passes string results through as-is instead of
+        # walking a dict again with its own JSON encoder. model_dump_json stays
+        # in pydantic-core end to end, with no intermediate dict.
+        if entry.cached_json is None:
+            entry.cached_json = entry.world.model_dump_json()
+        return entry.cached_json
+
+    except HTTPException as e:
+        await ctx.error(f"Failed to retrieve world data: {e.detail}")
+        raise
     except Exception as e:
-        ctx.error(f"Failed to retrieve world data: {e}")
-        logger.error(f"World data retrieval failed for {world_id}: {e}", exc_info=True)
+        await ctx.error(f"Failed to retrieve world data: {e}")
+        logger.error("World data retrieval failed for %s: %s", world_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # 5. Character Creation Tool
 @mcp.tool
-def create_character(world_id: str, character_data: dict, ctx: Context) -> dict:
+async def create_character(world_id: str, character_data: dict, ctx: Context) -> dict:
     """
     Creates and assigns a player character to an existing game world.
 
@@ -283,32 +438,32 @@ def create_character(world_id: str, character_data: dict, ctx: Context) -> dict:
     """
     try:
         # Input validation
-        if not world_id or not isinstance(world_id, str):
-            raise ValueError("World ID must be a non-empty string")
         if not character_data or not isinstance(character_data, dict):
-            raise ValueError("Character data must be a non-empty dictionary")
+            raise HTTPException(status_code=400, detail="Character data must be a non-empty dictionary")
 
-        # World validation
-        if world_id not in WORLD_STORAGE:
-            ctx.error(f"World ID not found: {world_id}")
-            raise HTTPException(status_code=404, detail=f"World with ID '{world_id}' not found.")
+        # Fail fast on a missing world or existing protagonist before validating
+        if _require_world(world_id).world.protagonist:
+            raise HTTPException(status_code=409, detail=_CHARACTER_EXISTS_DETAIL)
 
-        world = WORLD_STORAGE[world_id]
+        # Validate outside the lock so large payloads don't block other writers
+        new_character = await _validate_payload(_PC_ADAPTER, character_data)
 
-        # Check if character already exists
-        if world.protagonist:
-            ctx.error(f"Character already exists for world {world_id}")
-            raise HTTPException(
-                status_code=409,
-                detail="Character already exists for this world. Each world can have only one protagonist."
-            )
+        async with WORLD_STORAGE_LOCK:
+            # Re-check: the world may have changed while validation ran
+            entry = _require_world(world_id)
+            WORLD_STORAGE.move_to_end(world_id)
+            world = entry.world
+            if world.protagonist:
+                raise HTTPException(status_code=409, detail=_CHARACTER_EXISTS_DETAIL)
 
-        # Validate and create character
-        new_character = PlayerCharacter.parse_obj(character_data)
-        world.protagonist = new_character
+            world.protagonist = new_character
+            entry.characters[new_character.name] = world.protagonist
+            entry.summary["has_character"] = True
+            entry.summary["character_name"] = new_character.name
+            entry.cached_json = None
 
-        ctx.info(f"Successfully created character '{new_character.name}' for world {world_id}")
-        logger.info(f"Character created: {new_character.name} in world {world_id}")
+        await ctx.info(f"Successfully created character '{new_character.name}' for world {world_id}")
+        logger.info("Character created: %s in world %s", new_character.name, world_id)
 
         return {
             "message": "Character created successfully.",
@@ -318,17 +473,20 @@ def create_character(world_id: str, character_data: dict, ctx: Context) -> dict:
             "location": new_character.current_location
         }
 
-    except ValueError as e:
-        ctx.error(f"Invalid input: {e}")
+    except ValidationError as e:
+        await ctx.error(f"Invalid input: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        await ctx.error(f"Failed to create character: {e.detail}")
+        raise
     except Exception as e:
-        ctx.error(f"Failed to create character: {e}")
-        logger.error(f"Character creation failed for world {world_id}: {e}", exc_info=True)
+        await ctx.error(f"Failed to create character: {e}")
+        logger.error("Character creation failed for world %s: %s", world_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to create character")
 
 # 6. Additional Tools for Enhanced Gameplay
 @mcp.tool
-def update_character_location(world_id: str, character_name: str, new_location: str, ctx: Context) -> dict:
+async def update_character_location(world_id: str, character_name: str, new_location: str, ctx: Context) -> dict:
     """
     Updates a character's current location in the game world.
 
@@ -345,18 +503,19 @@ def update_character_location(world_id: str, character_name: str, new_location:
         dict: Success message with location update details
     """
     try:
-        if world_id not in WORLD_STORAGE:
-            raise HTTPException(status_code=404, detail="World not found.")
+        async with WORLD_STORAGE_LOCK:
+            entry = _require_world(world_id)
+            WORLD_STORAGE.move_to_end(world_id)
+            character = entry.characters.get(character_name)
+            if character is None:
+                raise HTTPException(status_code=404, detail="Character not found in this world.")
 
-        world = WORLD_STORAGE[world_id]
-        if not world.protagonist or world.protagonist.name != character_name:
-            raise HTTPException(status_code=404, detail="Character not found in this world.")
+            old_location = character.current_location
+            character.current_location = new_location
+            entry.cached_json = None
 
-        old_location = world.protagonist.current_location
-        world.protagonist.current_location = new_location
-
-        ctx.info(f"Moved {character_name} from {old_location} to {new_location}")
-        logger.info(f"Character location updated: {character_name} -> {new_location}")
+        await ctx.info(f"Moved {character_name} from {old_location} to {new_location}")
+        logger.info("Character location updated: %s -> %s", character_name, new_location)
 
         return {
             "message": f"Successfully moved {character_name}",
@@ -364,12 +523,15 @@ def update_character_location(world_id: str, character_name: str, new_location:
             "new_location": new_location
         }
 
+    except HTTPException as e:
+        await ctx.error(f"Failed to update character location: {e.detail}")
+        raise
     except Exception as e:
-        ctx.error(f"Failed to update character location: {e}")
+        await ctx.error(f"Failed to update character location: {e}")
         raise HTTPException(status_code=500, detail="Failed to update location")
 
 @mcp.tool
-def list_worlds(ctx: Context) -> dict:
+async def list_worlds(ctx: Context) -> ToolResult:
     """
     Lists all generated worlds with their basic information.
 
@@ -380,28 +542,23 @@ def list_worlds(ctx: Context) -> dict:
         ctx: FastMCP context for logging
 
     Returns:
-        dict: List of all worlds with metadata
+        ToolResult: List of all worlds with metadata, as structured content
+        and as orjson-encoded text
     """
     try:
-        worlds_info = []
-        for world_id, world in WORLD_STORAGE.items():
-            worlds_info.append({
-                "world_id": world_id,
-                "name": world.metadata.name,
-                "style": world.metadata.style,
-                "description": world.metadata.description,
-                "has_character": world.protagonist is not None,
-                "character_name": world.protagonist.name if world.protagonist else None
-            })
-
-        ctx.info(f"Listed {len(worlds_info)} worlds")
-        return {
+        # Summary rows are maintained on write, so no model traversal here
+        worlds_info = [entry.summary for entry in WORLD_STORAGE.values()]
+
+        await ctx.info(f"Listed {len(worlds_info)} worlds")
+        payload = {
             "worlds": worlds_info,
             "total_count": len(worlds_info)
         }
+        # Encode the text block ourselves instead of FastMCP's default serializer
+        return ToolResult(content=orjson.dumps(payload).decode(), structured_content=payload)
 
     except Exception as e:
-        ctx.error(f"Failed to list worlds: {e}")
+        await ctx.error(f"Failed to list worlds: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve world list")
 
 # 6. Runnable block
@@ -425,11 +582,18 @@ if __name__ == "__main__":
 
     print(f"Starting FastMCP server on port {port} with enhanced mcp_use compatibility...")
 
+    # Keep idle client connections open long enough for clients to reuse them,
+    # and cap concurrent connections rather than accepting sockets without bound
+    uvicorn_config = {
+        "timeout_keep_alive": int(os.getenv("MCP_KEEPALIVE", "30")),
+        "limit_concurrency": int(os.getenv("MCP_MAX_CONNECTIONS", "500"))
+    }
+
     # Enhanced transport configuration for better mcp_use compatibility
     try:
         # Try Streamable HTTP first (mcp_use preferred)
         print("Trying Streamable HTTP transport...")
-        mcp.run(transport="http", port=port, host="127.0.0.1")
+        mcp.run(transport="http", port=port, host="127.0.0.1", uvicorn_config=uvicorn_config)
     except Exception as e:
         logger.error(f"Streamable HTTP transport failed: {e}")
         print(f"❌ Streamable HTTP transport failed: {e}")
@@ -441,7 +605,7 @@ if __name__ == "__main__":
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.bind(('127.0.0.1', attempt_port))
                 print(f"   Trying alternative port {attempt_port}...")
-                mcp.run(transport="http", port=attempt_port, host="127.0.0.1")
+                mcp.run(transport="http", port=attempt_port, host="127.0.0.1", uvicorn_config=uvicorn_config)
                 break
             except OSError:
                 continue
@@ -449,7 +613,7 @@ if __name__ == "__main__":
             print("   No available ports found in range")
             try:
                 print("Trying SSE transport as fallback...")
-                mcp.run(transport="sse", port=port, host="127.0.0.1")
+                mcp.run(transport="sse", port=port, host="127.0.0.1", uvicorn_config=uvicorn_config)
             except Exception as e2:
                 logger.error(f"SSE transport failed: {e2}")
                 print(f"❌ SSE transport failed: {e2}")
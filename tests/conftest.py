@@ -1,9 +1,11 @@
 """
 Test configuration and shared fixtures for the Game World Sandbox MCP tests.
 """
+import copy
 import pytest
 import uuid
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from faker import Faker
 
 from world_bible_schema import (
@@ -13,8 +15,12 @@ from world_bible_schema import (
 
 fake = Faker()
 
-# Test data factories
-@pytest.fixture
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: full nested WorldBible validation; deselect with -m 'not slow'")
+
+# Test data factories. These are read-only inputs, so each is built once per
+# session; a test that needs to change one must copy it first.
+@pytest.fixture(scope="session")
 def sample_metadata() -> Dict[str, Any]:
     """Sample metadata for testing."""
     return {
@@ -26,7 +32,7 @@ def sample_metadata() -> Dict[str, Any]:
         "tags": ["test", "fantasy"]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cosmology() -> Dict[str, Any]:
     """Sample cosmology for testing."""
     return {
@@ -37,7 +43,7 @@ def sample_cosmology() -> Dict[str, Any]:
         "metaphysics": "Spiritual energy permeates the world"
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_geography() -> Dict[str, Any]:
     """Sample geography for testing."""
     return {
@@ -67,7 +73,7 @@ def sample_geography() -> Dict[str, Any]:
         ]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_society() -> Dict[str, Any]:
     """Sample society for testing."""
     return {
@@ -102,7 +108,7 @@ def sample_society() -> Dict[str, Any]:
         ]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_history() -> Dict[str, Any]:
     """Sample history for testing."""
     return {
@@ -122,7 +128,7 @@ def sample_history() -> Dict[str, Any]:
         "lost_knowledge": ["Ancient rune magic", "Lost city locations"]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_systems() -> Dict[str, Any]:
     """Sample systems for testing."""
     return {
@@ -134,7 +140,7 @@ def sample_systems() -> Dict[str, Any]:
         "crafting_system": "Skill-based crafting with quality modifiers"
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_character_attributes() -> Dict[str, Any]:
     """Sample character attributes for testing."""
     return {
@@ -155,7 +161,7 @@ def sample_character_attributes() -> Dict[str, Any]:
         "movement_speed": 12
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_skills() -> List[Dict[str, Any]]:
     """Sample skills for testing."""
     return [
@@ -175,7 +181,7 @@ def sample_skills() -> List[Dict[str, Any]]:
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_inventory() -> List[Dict[str, Any]]:
     """Sample inventory for testing."""
     return [
@@ -201,7 +207,7 @@ def sample_inventory() -> List[Dict[str, Any]]:
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_player_character(sample_character_attributes, sample_skills, sample_inventory) -> Dict[str, Any]:
     """Complete sample player character for testing."""
     return {
@@ -234,7 +240,47 @@ def sample_player_character(sample_character_attributes, sample_skills, sample_i
         "relationships": {"Elven Council": "trusted", "Forest Spirits": "protected", "Dark Forces": "enemy"}
     }
 
+@pytest.fixture(scope="session")
+def warrior_character_data() -> Mapping[str, Any]:
+    """Valid character input for the server helpers; tests use the character_data copy."""
+    return MappingProxyType({
+        "name": "Test Character",
+        "race": "Human",
+        "character_class": "Warrior",
+        "level": 1,
+        "experience": 0,
+        "description": "A test character with basic warrior training",
+        "backstory": "Born in a small village, raised by local warriors, trained in combat and basic survival skills from an early age.",
+        "attributes": {
+            "health": 100,
+            "max_health": 100,
+            "mana": 10,
+            "max_mana": 10,
+            "stamina": 80,
+            "max_stamina": 80,
+            "strength": 14,
+            "agility": 12,
+            "intelligence": 10,
+            "wisdom": 10,
+            "charisma": 10,
+            "luck": 8,
+            "armor_class": 14,
+            "magic_resistance": 5,
+            "movement_speed": 10
+        },
+        "current_location": "Test Location",
+        "goals": ["Become a great warrior", "Protect the village"],
+        "reputation": {},
+        "quests": [],
+        "status_effects": []
+    })
+
 @pytest.fixture
+def character_data(warrior_character_data) -> Dict[str, Any]:
+    """Per-test deep copy of the warrior character input, safe to mutate."""
+    return copy.deepcopy(dict(warrior_character_data))
+
+@pytest.fixture(scope="session")
 def sample_world_bible_data(sample_metadata, sample_cosmology, sample_geography,
                           sample_society, sample_history, sample_systems) -> Dict[str, Any]:
     """Complete sample world bible data for testing."""
@@ -247,22 +293,46 @@ def sample_world_bible_data(sample_metadata, sample_cosmology, sample_geography,
         "systems": sample_systems
     }
 
+@pytest.fixture(scope="session")
+def base_world(sample_world_bible_data) -> WorldBible:
+    """Validated sample world; derive variants with model_copy instead of mutating it."""
+    return WorldBible(**sample_world_bible_data)
+
 @pytest.fixture
 def world_id() -> str:
     """Generate a test world ID."""
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
-@pytest.fixture
-def mock_context():
-    """Mock FastMCP context for testing."""
-    class MockContext:
-        async def info(self, message: str):
-            pass
+class _Done:
+    """Already-finished awaitable; awaiting it returns None immediately."""
+    __slots__ = ()
+
+    def __await__(self):
+        return iter(())
 
-        async def error(self, message: str):
-            pass
+_DONE = _Done()
 
-        async def warning(self, message: str):
-            pass
+class _NullContext:
+    """No-op FastMCP context for both the sync helpers and the async tools.
 
-    return MockContext()
+    Each method returns a shared finished awaitable, so sync callers can
+    ignore the result and async callers can await it without a coroutine
+    being created per call.
+    """
+    __slots__ = ()
+
+    def info(self, message: str):
+        return _DONE
+
+    def error(self, message: str):
+        return _DONE
+
+    def warning(self, message: str):
+        return _DONE
+
+_NULL_CONTEXT = _NullContext()
+
+@pytest.fixture
+def null_context():
+    """Shared no-op context for server helpers and tools."""
+    return _NULL_CONTEXT
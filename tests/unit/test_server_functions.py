@@ -1,114 +1,146 @@
 """
 Unit tests for server functions and tools.
 """
+import copy
 import pytest
 import uuid
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
 
-from server import WORLD_STORAGE
-from world_bible_schema import WorldBible, PlayerCharacter
+from server import WORLD_STORAGE, WorldEntry, _world_summary
+from world_bible_schema import WorldBible, PlayerCharacter, GameStyle
+
+_log = logging.getLogger(__name__)
+
+_VALID_STYLES = frozenset(style.value for style in GameStyle)
+
+# Simple world templates for testing
+_WORLD_TEMPLATES = MappingProxyType({
+    "Fantasy": {
+        "magic_system": "Elemental magic drawn from nature spirits",
+        "tech_level": "Medieval",
+        "calendar_system": "Twelve-month lunar calendar",
+        "economy": "Mixed barter and gold standard",
+        "abilities": "Magic schools and martial skills",
+        "items": "Weapons, armor, potions, scrolls"
+    },
+    "Sci-Fi": {
+        "magic_system": "No magic - advanced technology",
+        "tech_level": "Interstellar",
+        "calendar_system": "Galactic Standard Time",
+        "economy": "Digital credits and crypto",
+        "abilities": "Cybernetics and tech skills",
+        "items": "Energy weapons, medical nanites"
+    }
+})
+
+@lru_cache(maxsize=16)
+def _build_world_data(style: str) -> dict:
+    """Build the world data skeleton for a style; deep-copy it before use.
+
+    Flat string lists are tuples so deepcopy can reuse them; validation
+    turns them back into lists.
+    """
+    template = _WORLD_TEMPLATES.get(style, _WORLD_TEMPLATES["Fantasy"])
+    style_lower = style.lower()
+
+    return {
+        "metadata": {
+            "name": f"{style} Test World",
+            "description": f"A test {style_lower} world.",
+            "style": style,
+            "version": "1.0.0",
+            "author": "Test Author",
+            "tags": ("test", style_lower)
+        },
+        "cosmology": {
+            "magic_system": template["magic_system"],
+            "tech_level": template["tech_level"],
+            "calendar_system": template["calendar_system"],
+            "physics_laws": "Test physics",
+            "metaphysics": "Test metaphysics"
+        },
+        "geography": {
+            "macro_geography": "Three main continents",
+            "key_regions": [
+                {"name": "Starting Village", "description": "A humble beginning"},
+                {"name": "Ancient Ruins", "description": "Remnants of a lost civilization"},
+                {"name": "Capital City", "description": "The political and economic heart"}
+            ],
+            "climate_zones": ("Temperate", "Tropical"),
+            "natural_resources": ("Gold", "Silver"),
+            "strategic_locations": ()
+        },
+        "society": {
+            "races": [
+                {"name": "Humans", "description": "Adaptable and numerous"},
+                {"name": "Elves", "description": "Graceful and long-lived"} if style == "Fantasy" else {"name": "Androids", "description": "Artificial beings"}
+            ],
+            "factions": [
+                {"name": "Merchants Guild", "description": "Controls trade"},
+                {"name": "Mages Council", "description": "Regulates magical practices"} if "magic" in template["magic_system"].lower() else {"name": "Tech Consortium", "description": "Advances technology"}
+            ],
+            "social_structure": "A hierarchical feudal system with nobility, merchants, and commoners living in a structured society.",
+            "cultural_traits": ("Honor-bound", "Magic-respecting"),
+            "languages": ("Common", "Elvish"),
+            "religions": [
+                {"name": "Nature Pantheon", "description": "Worship of nature spirits"}
+            ]
+        },
+        "history": {
+            "creation_myth": f"The {style_lower} realm was shaped by ancient forces in a great cataclysm that changed the world forever.",
+            "major_conflicts": f"The Great {style} War that raged for centuries and shaped the current political landscape.",
+            "historical_events": (
+                "Founding of the First Kingdom",
+                "The Great Migration Period",
+                "The Industrial Revolution"
+            ),
+            "timeline": {},
+            "prophecies": (),
+            "lost_knowledge": ()
+        },
+        "systems": {
+            "economy": template["economy"] + " The main currency is gold coins and various trade goods.",
+            "abilities": template["abilities"],
+            "items": template["items"],
+            "combat_system": "D20-based combat",
+            "progression_system": "Level-based advancement",
+            "crafting_system": None
+        }
+    }
+
+@pytest.fixture(autouse=True)
+def _clean_storage():
+    """Start and finish every test with empty world storage."""
+    WORLD_STORAGE.clear()
+    yield
+    WORLD_STORAGE.clear()
+
+# Test helper functions that mirror the server logic; the real async tools
+# are exercised in test_server_tools.py
+def _stored_world(world_id: str):
+    """Return the WorldBible stored under world_id, or None."""
+    entry = WORLD_STORAGE.get(world_id)
+    return entry.world if entry is not None else None
 
-# Test helper functions that mirror the server logic
 def _generate_world(style: str, ctx):
     """Test version of generate_world function."""
     try:
-        if not style or not isinstance(style, str):
+        if not isinstance(style, str) or not style:
             raise ValueError("Style must be a non-empty string")
+        if style not in _VALID_STYLES:
+            raise ValueError(f"Unsupported style '{style}'")
 
-        world_id = str(uuid.uuid4())
-        logging.info(f"Starting world generation for style: {style}")
-
-        # Simple world templates for testing
-        world_templates = {
-            "Fantasy": {
-                "magic_system": "Elemental magic drawn from nature spirits",
-                "tech_level": "Medieval",
-                "calendar_system": "Twelve-month lunar calendar",
-                "economy": "Mixed barter and gold standard",
-                "abilities": "Magic schools and martial skills",
-                "items": "Weapons, armor, potions, scrolls"
-            },
-            "Sci-Fi": {
-                "magic_system": "No magic - advanced technology",
-                "tech_level": "Interstellar",
-                "calendar_system": "Galactic Standard Time",
-                "economy": "Digital credits and crypto",
-                "abilities": "Cybernetics and tech skills",
-                "items": "Energy weapons, medical nanites"
-            }
-        }
-
-        template = world_templates.get(style, world_templates["Fantasy"])
+        world_id = uuid.uuid4().hex
+        _log.info("Starting world generation for style: %s", style)
 
-        world_data = {
-            "metadata": {
-                "name": f"{style} Test World",
-                "description": f"A test {style.lower()} world.",
-                "style": style,
-                "version": "1.0.0",
-                "author": "Test Author",
-                "tags": ["test", style.lower()]
-            },
-            "cosmology": {
-                "magic_system": template["magic_system"],
-                "tech_level": template["tech_level"],
-                "calendar_system": template["calendar_system"],
-                "physics_laws": "Test physics",
-                "metaphysics": "Test metaphysics"
-            },
-            "geography": {
-                "macro_geography": "Three main continents",
-                "key_regions": [
-                    {"name": "Starting Village", "description": "A humble beginning"},
-                    {"name": "Ancient Ruins", "description": "Remnants of a lost civilization"},
-                    {"name": "Capital City", "description": "The political and economic heart"}
-                ],
-                "climate_zones": ["Temperate", "Tropical"],
-                "natural_resources": ["Gold", "Silver"],
-                "strategic_locations": []
-            },
-            "society": {
-                "races": [
-                    {"name": "Humans", "description": "Adaptable and numerous"},
-                    {"name": "Elves", "description": "Graceful and long-lived"} if style == "Fantasy" else {"name": "Androids", "description": "Artificial beings"}
-                ],
-                "factions": [
-                    {"name": "Merchants Guild", "description": "Controls trade"},
-                    {"name": "Mages Council", "description": "Regulates magical practices"} if "magic" in template["magic_system"].lower() else {"name": "Tech Consortium", "description": "Advances technology"}
-                ],
-                "social_structure": "A hierarchical feudal system with nobility, merchants, and commoners living in a structured society.",
-                "cultural_traits": ["Honor-bound", "Magic-respecting"],
-                "languages": ["Common", "Elvish"],
-                "religions": [
-                    {"name": "Nature Pantheon", "description": "Worship of nature spirits"}
-                ]
-            },
-            "history": {
-                "creation_myth": f"The {style.lower()} realm was shaped by ancient forces in a great cataclysm that changed the world forever.",
-                "major_conflicts": f"The Great {style} War that raged for centuries and shaped the current political landscape.",
-                "historical_events": [
-                    "Founding of the First Kingdom",
-                    "The Great Migration Period",
-                    "The Industrial Revolution"
-                ],
-                "timeline": {},
-                "prophecies": [],
-                "lost_knowledge": []
-            },
-            "systems": {
-                "economy": template["economy"] + " The main currency is gold coins and various trade goods.",
-                "abilities": template["abilities"],
-                "items": template["items"],
-                "combat_system": "D20-based combat",
-                "progression_system": "Level-based advancement",
-                "crafting_system": None
-            }
-        }
+        world_data = copy.deepcopy(_build_world_data(style))
 
         world = WorldBible(**world_data)
-        WORLD_STORAGE[world_id] = world
+        WORLD_STORAGE[world_id] = WorldEntry(world, _world_summary(world_id, world))
 
         ctx.info(f"Successfully created test world {world_id}")
         return {
@@ -123,23 +155,29 @@ def _generate_world(style: str, ctx):
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to generate world")
 
-def _create_character(world_id: str, character_data: dict, ctx):
-    """Test version of create_character function."""
+def _create_character(world_id: str, character_data: dict, ctx, _trusted: bool = False):
+    """Test version of create_character function.
+
+    Pass ``_trusted=True`` for known-good data to skip validation; nested
+    fields then stay plain dicts.
+    """
     try:
         if not world_id or not isinstance(world_id, str):
             raise ValueError("World ID must be a non-empty string")
         if not character_data or not isinstance(character_data, dict):
             raise ValueError("Character data must be a non-empty dictionary")
 
-        if world_id not in WORLD_STORAGE:
+        world = _stored_world(world_id)
+        if world is None:
             raise HTTPException(status_code=404, detail=f"World with ID '{world_id}' not found.")
 
-        world = WORLD_STORAGE[world_id]
-
         if world.protagonist:
             raise HTTPException(status_code=409, detail="Character already exists for this world.")
 
-        character = PlayerCharacter(**character_data)
+        if _trusted:
+            character = PlayerCharacter.model_construct(_fields_set=set(character_data), **character_data)
+        else:
+            character = PlayerCharacter(**character_data)
         world.protagonist = character
 
         ctx.info(f"Successfully created character '{character.name}' for world {world_id}")
@@ -164,12 +202,12 @@ def _get_world_data(world_id: str, ctx):
         if not world_id or not isinstance(world_id, str):
             raise ValueError("World ID must be a non-empty string")
 
-        if world_id not in WORLD_STORAGE:
+        world = _stored_world(world_id)
+        if world is None:
             raise HTTPException(status_code=404, detail=f"World with ID '{world_id}' not found.")
 
-        world = WORLD_STORAGE[world_id]
         ctx.info(f"Retrieved world data for {world_id}")
-        return world.dict()
+        return world.model_dump()
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -177,15 +215,15 @@ def _get_world_data(world_id: str, ctx):
 def _update_character_location(world_id: str, character_name: str, new_location: str, ctx):
     """Test version of update_character_location function."""
     try:
-        if world_id not in WORLD_STORAGE:
+        world = _stored_world(world_id)
+        if world is None:
             raise HTTPException(status_code=404, detail="World not found.")
 
-        world = WORLD_STORAGE[world_id]
-        if not world.protagonist or world.protagonist.name != character_name:
+        if (prot := world.protagonist) is None or prot.name != character_name:
             raise HTTPException(status_code=404, detail="Character not found in this world.")
 
-        old_location = world.protagonist.current_location
-        world.protagonist.current_location = new_location
+        old_location = prot.current_location
+        prot.current_location = new_location
 
         ctx.info(f"Moved {character_name} from {old_location} to {new_location}")
         return {
@@ -202,21 +240,23 @@ def _update_character_location(world_id: str, character_name: str, new_location:
 def _list_worlds(ctx):
     """Test version of list_worlds function."""
     try:
-        worlds_info = []
-        for world_id, world in WORLD_STORAGE.items():
-            worlds_info.append({
+        worlds_info = [
+            {
                 "world_id": world_id,
-                "name": world.metadata.name,
-                "style": world.metadata.style.value,
-                "description": world.metadata.description,
-                "has_character": world.protagonist is not None,
-                "character_name": world.protagonist.name if world.protagonist else None
-            })
-
-        ctx.info(f"Listed {len(worlds_info)} worlds")
+                "name": (meta := entry.world.metadata).name,
+                "style": meta.style.value,
+                "description": meta.description,
+                "has_character": (prot := entry.world.protagonist) is not None,
+                "character_name": prot.name if prot else None
+            }
+            for world_id, entry in WORLD_STORAGE.items()
+        ]
+        count = len(worlds_info)
+
+        ctx.info(f"Listed {count} worlds")
         return {
             "worlds": worlds_info,
-            "total_count": len(worlds_info)
+            "total_count": count
         }
 
     except Exception as e:
@@ -227,13 +267,10 @@ def _list_worlds(ctx):
 class TestGenerateWorld:
     """Test world generation functionality."""
 
-    def test_generate_world_success(self, mock_context):
+    def test_generate_world_success(self, null_context):
         """Test successful world generation."""
-        # Clear storage
-        WORLD_STORAGE.clear()
-
         style = "Fantasy"
-        result = _generate_world(style, mock_context)
+        result = _generate_world(style, null_context)
 
         assert "world_id" in result
         assert "message" in result
@@ -243,35 +280,34 @@ class TestGenerateWorld:
         # Verify world was stored
         world_id = result["world_id"]
         assert world_id in WORLD_STORAGE
-        world = WORLD_STORAGE[world_id]
+        world = WORLD_STORAGE[world_id].world
         assert isinstance(world, WorldBible)
         assert world.metadata.style.value == "Fantasy"
 
-    def test_generate_world_different_styles(self, mock_context):
+    def test_generate_world_different_styles(self, null_context):
         """Test world generation with different styles."""
         styles = ["Sci-Fi", "Cyberpunk", "Fantasy"]
-        WORLD_STORAGE.clear()
 
         for style in styles:
-            result = _generate_world(style, mock_context)
+            result = _generate_world(style, null_context)
             world_id = result["world_id"]
-            world = WORLD_STORAGE[world_id]
+            world = WORLD_STORAGE[world_id].world
 
             assert world.metadata.style.value == style
             assert style in world.metadata.name
 
-    def test_generate_world_invalid_style(self, mock_context):
+    def test_generate_world_invalid_style(self, null_context):
         """Test world generation with invalid style."""
         with pytest.raises(HTTPException) as exc_info:
-            _generate_world("", mock_context)
+            _generate_world("", null_context)
 
         assert exc_info.value.status_code == 400
         assert "must be a non-empty string" in str(exc_info.value.detail)
 
-    def test_generate_world_with_none_style(self, mock_context):
+    def test_generate_world_with_none_style(self, null_context):
         """Test world generation with None style."""
         with pytest.raises(HTTPException) as exc_info:
-            _generate_world(None, mock_context)
+            _generate_world(None, null_context)
 
         assert exc_info.value.status_code == 400
 
@@ -280,174 +316,71 @@ class TestGenerateWorld:
 class TestCreateCharacter:
     """Test character creation functionality."""
 
-    def test_create_character_success(self, mock_context):
+    @pytest.mark.parametrize("style", ["Fantasy", "Sci-Fi", "Cyberpunk"])
+    def test_create_character_success(self, null_context, character_data, style):
         """Test successful character creation."""
-        WORLD_STORAGE.clear()
-
         # First create a world
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world(style, null_context)
         world_id = world_result["world_id"]
 
         # Create character
-        character_data = {
-            "name": "Test Character",
-            "race": "Human",
-            "character_class": "Warrior",
-            "level": 1,
-            "experience": 0,
-            "description": "A test character with basic warrior training",
-            "backstory": "Born in a small village, raised by local warriors, trained in combat and basic survival skills from an early age.",
-            "attributes": {
-                "health": 100,
-                "max_health": 100,
-                "mana": 10,
-                "max_mana": 10,
-                "stamina": 80,
-                "max_stamina": 80,
-                "strength": 14,
-                "agility": 12,
-                "intelligence": 10,
-                "wisdom": 10,
-                "charisma": 10,
-                "luck": 8,
-                "armor_class": 14,
-                "magic_resistance": 5,
-                "movement_speed": 10
-            },
-            "current_location": "Test Location",
-            "goals": ["Become a great warrior", "Protect the village"],
-            "reputation": {},
-            "quests": [],
-            "status_effects": []
-        }
-
-        result = _create_character(world_id, character_data, mock_context)
+        result = _create_character(world_id, character_data, null_context)
 
         assert "message" in result
         assert "Character created successfully" in result["message"]
         assert result["character_name"] == "Test Character"
 
         # Verify character was added to world
-        world = WORLD_STORAGE[world_id]
+        world = WORLD_STORAGE[world_id].world
         assert world.protagonist is not None
         assert world.protagonist.name == "Test Character"
         assert world.protagonist.character_class == "Warrior"
 
-    def test_create_character_world_not_found(self, mock_context):
+    def test_create_character_world_not_found(self, null_context, character_data):
         """Test character creation with non-existent world."""
-        fake_world_id = str(uuid.uuid4())
-
-        character_data = {
-            "name": "Test Character",
-            "race": "Human",
-            "character_class": "Warrior",
-            "level": 1,
-            "experience": 0,
-            "description": "A test character with basic warrior training",
-            "backstory": "Born in a small village, raised by local warriors, trained in combat and basic survival skills from an early age.",
-            "attributes": {
-                "health": 100,
-                "max_health": 100,
-                "mana": 10,
-                "max_mana": 10,
-                "stamina": 80,
-                "max_stamina": 80,
-                "strength": 14,
-                "agility": 12,
-                "intelligence": 10,
-                "wisdom": 10,
-                "charisma": 10,
-                "luck": 8,
-                "armor_class": 14,
-                "magic_resistance": 5,
-                "movement_speed": 10
-            },
-            "current_location": "Test Location",
-            "goals": ["Become a great warrior", "Protect the village"],
-            "reputation": {},
-            "quests": [],
-            "status_effects": []
-        }
+        fake_world_id = uuid.uuid4().hex
 
         with pytest.raises(HTTPException) as exc_info:
-            _create_character(fake_world_id, character_data, mock_context)
+            _create_character(fake_world_id, character_data, null_context)
 
         assert exc_info.value.status_code == 404
         assert "not found" in str(exc_info.value.detail)
 
-    def test_create_character_duplicate(self, mock_context):
+    def test_create_character_duplicate(self, null_context, character_data):
         """Test creating character when one already exists."""
-        WORLD_STORAGE.clear()
-
         # Create world and character
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
-        character_data = {
-            "name": "Test Character",
-            "race": "Human",
-            "character_class": "Warrior",
-            "level": 1,
-            "experience": 0,
-            "description": "A test character with basic warrior training",
-            "backstory": "Born in a small village, raised by local warriors, trained in combat and basic survival skills from an early age.",
-            "attributes": {
-                "health": 100,
-                "max_health": 100,
-                "mana": 10,
-                "max_mana": 10,
-                "stamina": 80,
-                "max_stamina": 80,
-                "strength": 14,
-                "agility": 12,
-                "intelligence": 10,
-                "wisdom": 10,
-                "charisma": 10,
-                "luck": 8,
-                "armor_class": 14,
-                "magic_resistance": 5,
-                "movement_speed": 10
-            },
-            "current_location": "Test Location",
-            "goals": ["Become a great warrior", "Protect the village"],
-            "reputation": {},
-            "quests": [],
-            "status_effects": []
-        }
-
-        _create_character(world_id, character_data, mock_context)
+        _create_character(world_id, character_data, null_context)
 
         # Try to create another character
         with pytest.raises(HTTPException) as exc_info:
-            _create_character(world_id, character_data, mock_context)
+            _create_character(world_id, character_data, null_context)
 
         assert exc_info.value.status_code == 409
         assert "already exists" in str(exc_info.value.detail)
 
-    def test_create_character_invalid_data(self, mock_context):
+    def test_create_character_invalid_data(self, null_context):
         """Test character creation with invalid data."""
-        WORLD_STORAGE.clear()
-
         # Create a world
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         # Test with empty data
         with pytest.raises(HTTPException) as exc_info:
-            _create_character(world_id, {}, mock_context)
+            _create_character(world_id, {}, null_context)
 
         assert exc_info.value.status_code == 400
         assert "must be a non-empty dictionary" in str(exc_info.value.detail)
 
-    def test_create_character_none_data(self, mock_context):
+    def test_create_character_none_data(self, null_context):
         """Test character creation with None data."""
-        WORLD_STORAGE.clear()
-
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         with pytest.raises(HTTPException) as exc_info:
-            _create_character(world_id, None, mock_context)
+            _create_character(world_id, None, null_context)
 
         assert exc_info.value.status_code == 400
 
@@ -455,56 +388,54 @@ class TestCreateCharacter:
 class TestGetWorldData:
     """Test world data retrieval functionality."""
 
-    def test_get_world_data_success(self, mock_context):
+    def test_get_world_data_success(self, null_context):
         """Test successful world data retrieval."""
-        WORLD_STORAGE.clear()
-
         # Create a world
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         # Retrieve world data
-        result = _get_world_data(world_id, mock_context)
+        result = _get_world_data(world_id, null_context)
 
         assert isinstance(result, dict)
         assert "metadata" in result
         assert "cosmology" in result
         assert result["metadata"]["name"] == world_result["world_name"]
 
-    def test_get_world_data_not_found(self, mock_context):
+    def test_get_world_data_not_found(self, null_context):
         """Test world data retrieval with non-existent world."""
-        fake_world_id = str(uuid.uuid4())
+        fake_world_id = uuid.uuid4().hex
 
         with pytest.raises(HTTPException) as exc_info:
-            _get_world_data(fake_world_id, mock_context)
+            _get_world_data(fake_world_id, null_context)
 
         assert exc_info.value.status_code == 404
         assert "not found" in str(exc_info.value.detail)
 
-    def test_get_world_data_invalid_id(self, mock_context):
+    # Empty string and None should be 400 (validation error)
+    # Invalid UUID format should be 404 (not found)
+    @pytest.mark.parametrize("invalid_id,expected_code", [
+        ("", 400),
+        (None, 400),
+        ("invalid-uuid", 404)
+    ], ids=["empty", "none", "unknown-id"])
+    def test_get_world_data_invalid_id(self, null_context, invalid_id, expected_code):
         """Test world data retrieval with invalid ID."""
-        invalid_ids = ["", None, "invalid-uuid"]
-
-        for invalid_id in invalid_ids:
-            with pytest.raises(HTTPException) as exc_info:
-                _get_world_data(invalid_id, mock_context)
+        with pytest.raises(HTTPException) as exc_info:
+            _get_world_data(invalid_id, null_context)
 
-            # Empty string and None should be 400 (validation error)
-            # Invalid UUID format should be 404 (not found)
-            expected_code = 404 if invalid_id == "invalid-uuid" else 400
-            assert exc_info.value.status_code == expected_code
+        assert exc_info.value.status_code == expected_code
 
 @pytest.mark.unit
 class TestUpdateCharacterLocation:
     """Test character location update functionality."""
 
-    def test_update_character_location_success(self, mock_context):
+    def test_update_character_location_success(self, null_context):
         pytest.skip("Skipping due to character validation issues - core functionality tested elsewhere")
         """Test successful character location update."""
-        WORLD_STORAGE.clear()
 
         # Create world and character
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         character_data = {
@@ -530,10 +461,10 @@ class TestUpdateCharacterLocation:
             },
             "current_location": "Starting Village"
         }
-        _create_character(world_id, character_data, mock_context)
+        _create_character(world_id, character_data, null_context)
 
         # Update location
-        result = _update_character_location(world_id, "Test Character", "Ancient Ruins", mock_context)
+        result = _update_character_location(world_id, "Test Character", "Ancient Ruins", null_context)
 
         assert "message" in result
         assert "Successfully moved" in result["message"]
@@ -541,28 +472,26 @@ class TestUpdateCharacterLocation:
         assert result["new_location"] == "Ancient Ruins"
 
         # Verify location was updated
-        world = WORLD_STORAGE[world_id]
+        world = WORLD_STORAGE[world_id].world
         assert world.protagonist.current_location == "Ancient Ruins"
 
-    def test_update_character_location_world_not_found(self, mock_context):
+    def test_update_character_location_world_not_found(self, null_context):
         """Test location update with non-existent world."""
-        fake_world_id = str(uuid.uuid4())
+        fake_world_id = uuid.uuid4().hex
 
         with pytest.raises(HTTPException) as exc_info:
-            _update_character_location(fake_world_id, "Test Character", "New Location", mock_context)
+            _update_character_location(fake_world_id, "Test Character", "New Location", null_context)
 
         assert exc_info.value.status_code == 404
 
-    def test_update_character_location_character_not_found(self, mock_context):
+    def test_update_character_location_character_not_found(self, null_context):
         """Test location update with non-existent character."""
-        WORLD_STORAGE.clear()
-
         # Create world without character
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         with pytest.raises(HTTPException) as exc_info:
-            _update_character_location(world_id, "Non-existent Character", "New Location", mock_context)
+            _update_character_location(world_id, "Non-existent Character", "New Location", null_context)
 
         assert exc_info.value.status_code == 404
 
@@ -570,29 +499,25 @@ class TestUpdateCharacterLocation:
 class TestListWorlds:
     """Test world listing functionality."""
 
-    def test_list_worlds_empty(self, mock_context):
+    def test_list_worlds_empty(self, null_context):
         """Test listing worlds when storage is empty."""
-        WORLD_STORAGE.clear()
-
-        result = _list_worlds(mock_context)
+        result = _list_worlds(null_context)
 
         assert result["worlds"] == []
         assert result["total_count"] == 0
 
-    def test_list_worlds_with_data(self, mock_context):
+    def test_list_worlds_with_data(self, null_context):
         """Test listing worlds with data."""
-        WORLD_STORAGE.clear()
-
         # Create multiple worlds
         styles = ["Fantasy", "Sci-Fi", "Cyberpunk"]
         world_ids = []
 
         for style in styles:
-            result = _generate_world(style, mock_context)
+            result = _generate_world(style, null_context)
             world_ids.append(result["world_id"])
 
         # List worlds
-        result = _list_worlds(mock_context)
+        result = _list_worlds(null_context)
 
         assert len(result["worlds"]) == 3
         assert result["total_count"] == 3
@@ -602,49 +527,16 @@ class TestListWorlds:
         for style in styles:
             assert any(style in name for name in world_names)
 
-    def test_list_worlds_with_characters(self, mock_context):
+    def test_list_worlds_with_characters(self, null_context, character_data):
         """Test listing worlds that have characters."""
-        WORLD_STORAGE.clear()
-
         # Create world and character
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
-        character_data = {
-            "name": "Test Character",
-            "race": "Human",
-            "character_class": "Warrior",
-            "level": 1,
-            "experience": 0,
-            "description": "A test character with basic warrior training",
-            "backstory": "Born in a small village, raised by local warriors, trained in combat and basic survival skills from an early age.",
-            "attributes": {
-                "health": 100,
-                "max_health": 100,
-                "mana": 10,
-                "max_mana": 10,
-                "stamina": 80,
-                "max_stamina": 80,
-                "strength": 14,
-                "agility": 12,
-                "intelligence": 10,
-                "wisdom": 10,
-                "charisma": 10,
-                "luck": 8,
-                "armor_class": 14,
-                "magic_resistance": 5,
-                "movement_speed": 10
-            },
-            "current_location": "Test Location",
-            "goals": ["Become a great warrior", "Protect the village"],
-            "reputation": {},
-            "quests": [],
-            "status_effects": []
-        }
-        _create_character(world_id, character_data, mock_context)
+        _create_character(world_id, character_data, null_context, _trusted=True)
 
         # List worlds
-        result = _list_worlds(mock_context)
+        result = _list_worlds(null_context)
 
         assert len(result["worlds"]) == 1
         world_info = result["worlds"][0]
@@ -655,37 +547,35 @@ class TestListWorlds:
 class TestWorldStorage:
     """Test world storage functionality."""
 
-    def test_world_storage_operations(self, mock_context):
+    def test_world_storage_operations(self, null_context):
         """Test basic world storage operations."""
-        WORLD_STORAGE.clear()
-
         # Test initial state
         assert len(WORLD_STORAGE) == 0
 
         # Add world
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         assert len(WORLD_STORAGE) == 1
         assert world_id in WORLD_STORAGE
 
         # Retrieve world
-        world = WORLD_STORAGE[world_id]
+        world = WORLD_STORAGE[world_id].world
         assert isinstance(world, WorldBible)
 
         # Test storage persistence
         assert len(WORLD_STORAGE) == 1
         assert world_id in WORLD_STORAGE
 
-    def test_world_storage_isolation(self, mock_context):
+    def test_world_storage_isolation(self, null_context):
         """Test that world storage is properly isolated between tests."""
-        # This test ensures storage doesn't persist between tests
-        initial_count = len(WORLD_STORAGE)
+        # The autouse fixture empties storage, so nothing leaks in from earlier tests
+        assert len(WORLD_STORAGE) == 0
 
         # Create a world
-        world_result = _generate_world("Fantasy", mock_context)
+        world_result = _generate_world("Fantasy", null_context)
         world_id = world_result["world_id"]
 
         # Verify world was added
-        assert len(WORLD_STORAGE) == initial_count + 1
+        assert len(WORLD_STORAGE) == 1
         assert world_id in WORLD_STORAGE
@@ -0,0 +1,233 @@
+"""
+Unit tests for the async server tools, called directly with a no-op context.
+"""
+import asyncio
+import json
+
+import pytest
+
+import server
+from server import WORLD_STORAGE
+
+
+@pytest.fixture(autouse=True)
+def _clean_storage():
+    """Start and finish every test with empty world storage."""
+    WORLD_STORAGE.clear()
+    yield
+    WORLD_STORAGE.clear()
+
+
+async def _new_world(ctx, style: str = "Fantasy") -> str:
+    """Generate a world through the tool and return its ID."""
+    return (await server.generate_world(style, ctx))["world_id"]
+
+
+async def _status_of(call) -> int:
+    """Await a tool call that must fail and return its HTTP status code."""
+    with pytest.raises(server.HTTPException) as exc_info:
+        await call
+    return exc_info.value.status_code
+
+
+@pytest.mark.unit
+@pytest.mark.world_generation
+class TestGenerateWorldTool:
+    """Test the generate_world tool."""
+
+    @pytest.mark.asyncio
+    async def test_generate_world_stores_entry(self, null_context):
+        """Test that a generated world is stored with its summary row."""
+        result = await server.generate_world("Sci-Fi", null_context)
+
+        entry = WORLD_STORAGE[result["world_id"]]
+        assert entry.world.metadata.name == result["world_name"] == "Sci-Fi Realm"
+        assert entry.summary["has_character"] is False
+        assert entry.cached_json is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("style", ["", None, "InvalidStyle"])
+    async def test_generate_world_invalid_style(self, null_context, style):
+        """Test that missing and unknown styles are rejected with 400."""
+        assert await _status_of(server.generate_world(style, null_context)) == 400
+        assert len(WORLD_STORAGE) == 0
+
+    @pytest.mark.asyncio
+    async def test_frameworks_not_shared_between_worlds(self, null_context):
+        """Test that mutating one world's frameworks leaves other worlds alone."""
+        first = await server.generate_world("Fantasy", null_context)
+        second = await server.generate_world("Fantasy", null_context)
+        world_a = WORLD_STORAGE[first["world_id"]].world
+        world_b = WORLD_STORAGE[second["world_id"]].world
+
+        world_a.economic_framework["base_prices"]["food"]["bread"] = 999
+        world_a.economic_framework["price_multipliers"]["rare"] = 0.0
+        world_a.mana_framework["spell_costs"]["minor"]["min"] = 999
+
+        assert world_b.economic_framework["base_prices"]["food"]["bread"] == 5
+        assert world_b.economic_framework["price_multipliers"]["rare"] == 10.0
+        assert world_b.mana_framework["spell_costs"]["minor"]["min"] == 5
+        assert server._BASE_PRICES["food"]["bread"] == 5
+
+
+@pytest.mark.unit
+@pytest.mark.character_creation
+class TestCreateCharacterTool:
+    """Test the create_character tool."""
+
+    @pytest.mark.asyncio
+    async def test_create_character_indexes_character(self, null_context, character_data):
+        """Test that a new protagonist is stored, indexed by name and listed."""
+        world_id = await _new_world(null_context)
+
+        result = await server.create_character(world_id, character_data, null_context)
+
+        entry = WORLD_STORAGE[world_id]
+        assert result["character_name"] == character_data["name"]
+        assert entry.characters[character_data["name"]] is entry.world.protagonist
+
+    @pytest.mark.asyncio
+    async def test_create_character_status_codes(self, null_context, character_data):
+        """Test the status codes for missing worlds, bad data and duplicates."""
+        world_id = await _new_world(null_context)
+
+        assert await _status_of(server.create_character("missing", character_data, null_context)) == 404
+        assert await _status_of(server.create_character("", character_data, null_context)) == 400
+        assert await _status_of(server.create_character(world_id, None, null_context)) == 400
+        assert await _status_of(server.create_character(world_id, {"name": "X"}, null_context)) == 400
+
+        await server.create_character(world_id, character_data, null_context)
+        assert await _status_of(server.create_character(world_id, character_data, null_context)) == 409
+
+    @pytest.mark.asyncio
+    async def test_concurrent_creation_allows_one_protagonist(self, null_context, character_data):
+        """Test that racing creations leave one protagonist and one 409."""
+        world_id = await _new_world(null_context)
+        # Large enough to validate on a worker thread, so both calls are in flight at once
+        character_data["goals"] = [f"Goal {i}" for i in range(server._OFFLOAD_VALIDATION_VALUES)]
+        rival = {**character_data, "name": "Rival Hero"}
+
+        results = await asyncio.gather(
+            server.create_character(world_id, character_data, null_context),
+            server.create_character(world_id, rival, null_context),
+            return_exceptions=True
+        )
+
+        failures = [r for r in results if isinstance(r, server.HTTPException)]
+        assert [f.status_code for f in failures] == [409]
+        assert list(WORLD_STORAGE[world_id].characters) == [WORLD_STORAGE[world_id].world.protagonist.name]
+
+    @pytest.mark.asyncio
+    async def test_oversized_integer_is_a_validation_error(self, null_context, character_data):
+        """Test that valid JSON pydantic rejects maps to 400, not 500."""
+        world_id = (await server.generate_world("Fantasy", null_context))["world_id"]
+        character_data["level"] = 10 ** 30
+
+        with pytest.raises(server.HTTPException) as exc_info:
+            await server.create_character(world_id, character_data, null_context)
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_large_payload_is_validated_off_loop(self, null_context, character_data):
+        """Test that a payload past the offload threshold still validates."""
+        world_id = (await server.generate_world("Fantasy", null_context))["world_id"]
+        character_data["goals"] = [f"Goal {i}" for i in range(server._OFFLOAD_VALIDATION_VALUES)]
+        assert server._payload_is_large(character_data)
+
+        result = await server.create_character(world_id, character_data, null_context)
+        assert result["character_name"] == character_data["name"]
+        assert len(WORLD_STORAGE[world_id].world.protagonist.goals) == server._OFFLOAD_VALIDATION_VALUES
+
+
+@pytest.mark.unit
+class TestWorldEviction:
+    """Test least-recently-used eviction of stored worlds."""
+
+    @pytest.mark.asyncio
+    async def test_character_writes_refresh_recency(self, null_context, character_data, monkeypatch):
+        """Test that worlds played through the tools outlive idle ones."""
+        monkeypatch.setattr(server, "_MAX_WORLDS", 2)
+        played = (await server.generate_world("Fantasy", null_context))["world_id"]
+        idle = (await server.generate_world("Fantasy", null_context))["world_id"]
+
+        await server.create_character(played, character_data, null_context)
+        third = (await server.generate_world("Fantasy", null_context))["world_id"]
+        assert list(WORLD_STORAGE) == [played, third]
+
+        await server.update_character_location(played, character_data["name"], "Capital City", null_context)
+        fourth = (await server.generate_world("Fantasy", null_context))["world_id"]
+        assert idle not in WORLD_STORAGE
+        assert list(WORLD_STORAGE) == [played, fourth]
+
+
+@pytest.mark.unit
+class TestGetWorldDataTool:
+    """Test the get_world_data resource."""
+
+    @pytest.mark.asyncio
+    async def test_get_world_data_caches_json(self, null_context):
+        """Test that the resource returns the world as JSON and caches it."""
+        world_id = await _new_world(null_context)
+
+        data = await server.get_world_data(world_id, null_context)
+
+        assert json.loads(data)["metadata"]["name"] == "Fantasy Realm"
+        assert WORLD_STORAGE[world_id].cached_json is data
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("world_id,expected_code", [("missing", 404), ("", 400), (None, 400)])
+    async def test_get_world_data_status_codes(self, null_context, world_id, expected_code):
+        """Test the status codes for unknown and malformed world IDs."""
+        assert await _status_of(server.get_world_data(world_id, null_context)) == expected_code
+
+
+@pytest.mark.unit
+class TestUpdateCharacterLocationTool:
+    """Test the update_character_location tool."""
+
+    @pytest.mark.asyncio
+    async def test_move_refreshes_cached_json(self, null_context, character_data):
+        """Test that a move invalidates the cached JSON so reads see it."""
+        world_id = await _new_world(null_context)
+        await server.create_character(world_id, character_data, null_context)
+        before = json.loads(await server.get_world_data(world_id, null_context))
+
+        result = await server.update_character_location(
+            world_id, character_data["name"], "Ancient Ruins", null_context
+        )
+
+        after = json.loads(await server.get_world_data(world_id, null_context))
+        assert result["old_location"] == before["protagonist"]["current_location"]
+        assert after["protagonist"]["current_location"] == "Ancient Ruins"
+
+    @pytest.mark.asyncio
+    async def test_update_location_status_codes(self, null_context, character_data):
+        """Test the status codes for unknown worlds and characters."""
+        world_id = await _new_world(null_context)
+        move = server.update_character_location
+
+        assert await _status_of(move("missing", character_data["name"], "Ruins", null_context)) == 404
+        assert await _status_of(move(world_id, character_data["name"], "Ruins", null_context)) == 404
+
+        await server.create_character(world_id, character_data, null_context)
+        assert await _status_of(move(world_id, "Nobody", "Ruins", null_context)) == 404
+
+
+@pytest.mark.unit
+class TestListWorldsTool:
+    """Test the list_worlds tool."""
+
+    @pytest.mark.asyncio
+    async def test_list_worlds_row_tracks_character(self, null_context, character_data):
+        """Test that a world's summary row changes after character creation."""
+        world_id = await _new_world(null_context)
+
+        before = (await server.list_worlds(null_context)).structured_content
+        await server.create_character(world_id, character_data, null_context)
+        after = (await server.list_worlds(null_context)).structured_content
+
+        assert before["total_count"] == after["total_count"] == 1
+        assert before["worlds"][0]["has_character"] is False
+        assert before["worlds"][0]["character_name"] is None
+        assert after["worlds"][0]["has_character"] is True
+        assert after["worlds"][0]["character_name"] == character_data["name"]
@@ -0,0 +1,44 @@
+"""
+Unit tests for WorldBible creation and game enums.
+"""
+import pytest
+
+from world_bible_schema import WorldBible, PlayerCharacter, GameStyle, TechLevel
+
+@pytest.mark.unit
+@pytest.mark.validation
+class TestWorldBible:
+    """Test world bible creation and enums."""
+
+    def test_valid_world_bible_creation(self, sample_world_bible_data):
+        """Test creating valid world bible."""
+        world = WorldBible(**sample_world_bible_data)
+        assert world.metadata.name.endswith("World")
+        assert world.cosmology.tech_level == TechLevel.MEDIEVAL
+        assert len(world.geography.key_regions) >= 2
+
+    def test_world_bible_with_character(self, base_world, sample_player_character):
+        """Test world bible with player character."""
+        protagonist = PlayerCharacter(**sample_player_character)
+        world = base_world.model_copy(update={"protagonist": protagonist})
+        assert world.protagonist is not None
+        assert world.protagonist.name == "Elara Moonshadow"
+        assert world.protagonist.character_class == "Ranger"
+
+    def test_enum_validation(self):
+        """Test enum values for game styles and tech levels."""
+        assert GameStyle.FANTASY.value == "Fantasy"
+        assert TechLevel.INTERSTELLAR.value == "Interstellar"
+
+    @pytest.mark.parametrize("member", list(GameStyle) + list(TechLevel),
+                             ids=lambda m: f"{type(m).__name__}.{m.name}")
+    def test_enum_round_trip(self, member):
+        """Test that every enum member is recovered from its value."""
+        assert type(member)(member.value) is member
+
+    @pytest.mark.parametrize("enum_cls", [GameStyle, TechLevel])
+    def test_enum_invalid_value(self, enum_cls):
+        """Test that unknown values are rejected."""
+        with pytest.raises(ValueError):
+            enum_cls("InvalidStyle")
+
@@ -0,0 +1,70 @@
+"""
+Unit tests for WorldBible cross-section consistency validation.
+
+These run the full nested WorldBible validation and are marked ``slow``;
+deselect them with ``-m "not slow"``.
+"""
+import pytest
+from pydantic import ValidationError
+
+from world_bible_schema import WorldBible, GameStyle, TechLevel
+
+# Sci-Fi world whose traditional magic system contradicts its tech level
+_SCIFI_WORLD_DATA = {
+    "metadata": {
+        "name": "Test World",
+        "description": "A test world with inconsistent settings",
+        "style": GameStyle.SCI_FI
+    },
+    "cosmology": {
+        "magic_system": "Traditional spell casting and wizard towers",
+        "tech_level": TechLevel.INTERSTELLAR,
+        "calendar_system": "Galactic Standard Time",
+        "physics_laws": "Advanced physics",
+        "metaphysics": "Digital metaphysics"
+    },
+    "geography": {
+        "macro_geography": "Single planet with multiple continents",
+        "key_regions": [
+            {"name": "Region 1", "description": "Test region 1"},
+            {"name": "Region 2", "description": "Test region 2"},
+            {"name": "Region 3", "description": "Test region 3"}
+        ]
+    },
+    "society": {
+        "races": [
+            {"name": "Humans", "description": "Advanced human civilization"},
+            {"name": "Androids", "description": "Artificial beings"}
+        ],
+        "factions": [
+            {"name": "Tech Corp", "description": "Technology corporation"},
+            {"name": "Research Council", "description": "Scientific research organization"}
+        ],
+        "social_structure": "Corporate meritocracy"
+    },
+    "history": {
+        "creation_myth": "Digital creation story",
+        "major_conflicts": "The Robot Wars",
+        "historical_events": ["Digital Revolution", "AI Awakening", "Space Colonization"]
+    },
+    "systems": {
+        "economy": "Digital credits with blockchain transactions",
+        "abilities": "Cybernetic enhancements and AI integration",
+        "items": "Energy weapons, medical nanites, neural implants",
+        "combat_system": "Tech-based combat with hacking",
+        "progression_system": "Neural enhancement levels",
+        "crafting_system": "Digital fabrication"
+    }
+}
+
+@pytest.mark.unit
+@pytest.mark.validation
+@pytest.mark.slow
+class TestWorldBibleConsistency:
+    """Test world bible consistency validation."""
+
+    def test_world_consistency_validation(self):
+        """Test world consistency validation."""
+        # This should raise an error due to inconsistent magic/tech combination
+        with pytest.raises(ValidationError):
+            WorldBible(**_SCIFI_WORLD_DATA)
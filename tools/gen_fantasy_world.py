@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Generate _generated_fantasy_world.py from fantasy_world.json
+
+The demo world payload is static and already known to be valid, so instead of
+running it through pydantic validation at every start-up we emit a constructor
+that builds the WorldBible with model_construct() calls throughout. The
+slotted pydantic dataclasses (CharacterAttributes, Skill, InventoryItem) have
+no model_construct(), so they are emitted as plain constructor calls.
+
+The JSON is validated once here, at generation time, and the emitted code is
+derived from the validated model, so the generated constructor can never carry
+data the schema would reject.
+
+Usage:
+    python tools/gen_fantasy_world.py
+"""
+
+import dataclasses
+import sys
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from world_bible_schema import WorldBible  # noqa: E402
+
+SOURCE = ROOT / "fantasy_world.json"
+TARGET = ROOT / "_generated_fantasy_world.py"
+
+HEADER = '''"""
+Pre-built constructor for the demo fantasy world.
+
+GENERATED by tools/gen_fantasy_world.py from fantasy_world.json - do not edit.
+Re-run the generator after changing the JSON payload or the schema.
+"""
+
+from world_bible_schema import {imports}
+
+
+def make_fantasy_world() -> WorldBible:
+    """Build the demo WorldBible without re-running validation."""
+    return {body}
+'''
+
+
+def _emit(value, indent: int, names: set) -> str:
+    """Render a validated value as Python source, constructing models in place."""
+    pad = " " * indent
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        names.add(cls.__name__)
+        fields = [
+            f"{pad}    {name}={_emit(getattr(value, name), indent + 4, names)},"
+            for name in cls.model_fields
+            if name in value.model_fields_set
+        ]
+        if not fields:
+            return f"{cls.__name__}.model_construct()"
+        return f"{cls.__name__}.model_construct(\n" + "\n".join(fields) + f"\n{pad})"
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls = type(value)
+        names.add(cls.__name__)
+        fields = [
+            f"{pad}    {field.name}={_emit(getattr(value, field.name), indent + 4, names)},"
+            for field in dataclasses.fields(value)
+        ]
+        return f"{cls.__name__}(\n" + "\n".join(fields) + f"\n{pad})"
+    if isinstance(value, Enum):
+        names.add(type(value).__name__)
+        return f"{type(value).__name__}.{value.name}"
+    inline = repr(value)
+    if len(inline) + indent <= 80 or not isinstance(value, (dict, list)) or not value:
+        return inline
+    if isinstance(value, dict):
+        items = [f"{pad}    {key!r}: {_emit(item, indent + 4, names)}," for key, item in value.items()]
+        return "{\n" + "\n".join(items) + f"\n{pad}}}"
+    items = [f"{pad}    {_emit(item, indent + 4, names)}," for item in value]
+    return "[\n" + "\n".join(items) + f"\n{pad}]"
+
+
+def main() -> None:
+    world = WorldBible.model_validate_json(SOURCE.read_bytes())
+    names = set()
+    body = _emit(world, 4, names)
+    TARGET.write_text(HEADER.format(imports=", ".join(sorted(names)), body=body), encoding="utf-8")
+    print(f"Wrote {TARGET.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,201 @@
 Final verification script - demonstrates the working MCP integration
 """
 
+import argparse
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import io
+import socket
 import subprocess
 import sys
 import os
+import threading
+import time
 
-def verify_working_solution():
-    """Verify the MCP integration is working"""
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pooled session for all HTTP probes against the local server
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+atexit.register(_session.close)
+
+def wait_ready(host, port, process, deadline_s=10.0):
+    """Wait until host:port accepts TCP connections.
+
+    Returns False if the process exits first or the deadline passes.
+    """
+    deadline = time.monotonic() + deadline_s
+    attempt = 0
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(min(0.05 * 2 ** attempt, 0.2))
+            attempt += 1
+    return False
+
+class _McpServerPool:
+    """Shares one server.py process per (python, script, env) config.
+
+    Released servers stay up until interpreter exit, so repeated in-process
+    verifier runs skip the interpreter and FastMCP startup. The config key
+    includes the script's contents, so editing server.py starts a fresh
+    process; every server binds port 8000, so idle servers are stopped
+    before a new one starts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers = {}  # config hash -> [process, refcount]
+
+    @staticmethod
+    def _config_hash(script, env):
+        with open(script, "rb") as source:
+            script_digest = hashlib.sha256(source.read()).hexdigest()
+        key = repr((sys.executable, script, script_digest, tuple(sorted(env.items()))))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def acquire(self, script="server.py", env=None):
+        """Return (key, process), starting the server if none is alive."""
+        env = dict(os.environ if env is None else env)
+        key = self._config_hash(script, env)
+        with self._lock:
+            entry = self._servers.get(key)
+            if entry is None or entry[0].poll() is not None:
+                self._stop_idle_locked()
+                process = subprocess.Popen([sys.executable, script], env=env,
+                                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                entry = self._servers[key] = [process, 0]
+            entry[1] += 1
+            return key, entry[0]
+
+    def release(self, key):
+        with self._lock:
+            self._servers[key][1] -= 1
+
+    def stop_idle(self):
+        """Terminate pooled servers that no caller currently holds."""
+        with self._lock:
+            self._stop_idle_locked()
+
+    def _stop_idle_locked(self):
+        for key, (process, refcount) in list(self._servers.items()):
+            if refcount == 0:
+                del self._servers[key]
+                process.terminate()
+                process.wait()
+
+    def close(self):
+        """Terminate every pooled server."""
+        with self._lock:
+            servers = [process for process, _ in self._servers.values()]
+            self._servers.clear()
+        for process in servers:
+            process.terminate()
+            process.wait()
+
+_server_pool = _McpServerPool()
+atexit.register(_server_pool.close)
+
+def _run_unit_tests(verbose=False, fresh=False):
+    """Run the server unit tests; returns (exit_code, output).
+
+    Verbose runs stream pytest output live and return no output; quiet
+    runs buffer a short report to show only if the tests fail. Tests run
+    in-process unless ``fresh`` is set; repeated runs in one interpreter
+    need a subprocess, since pytest.main() cannot see edits to modules it
+    has already imported.
+    """
+    args = ["tests/unit/test_server_functions.py", "--tb=short"]
+    if fresh:
+        result = subprocess.run([sys.executable, "-m", "pytest", *args, "-v" if verbose else "-q"],
+                                stdout=None if verbose else subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True)
+        return result.returncode, result.stdout or ""
+    if verbose:
+        return pytest.main(args + ["-v"]), ""
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        exit_code = pytest.main(args + ["-q"])
+    return exit_code, output.getvalue()
+
+def _probe_server(server_process):
+    """Wait for the server port and GET /mcp; returns (ready, status_code).
+
+    If the process has exited by the end of the probe, whatever answered on
+    port 8000 was some other server, so the probe counts as a failure.
+    """
+    ready = wait_ready("127.0.0.1", 8000, server_process)
+    try:
+        status_code = _session.get("http://localhost:8000/mcp", timeout=2).status_code
+    except requests.RequestException:
+        status_code = None
+    if server_process.poll() is not None:
+        return False, None
+    return ready, status_code
+
+def _check_server(reuse_server=False):
+    """Start server.py, probe /mcp and stop it; returns (ready, status_code).
+
+    With ``reuse_server`` the process comes from the pool and is left
+    running for later runs. Prints nothing, since it runs while the unit
+    tests redirect stdout.
+    """
+    if reuse_server:
+        key, server_process = _server_pool.acquire()
+        try:
+            return _probe_server(server_process)
+        finally:
+            _server_pool.release(key)
+
+    # A pooled server would hold port 8000 and answer in place of this one
+    _server_pool.stop_idle()
+    server_process = subprocess.Popen([
+        sys.executable, "server.py"
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    try:
+        return _probe_server(server_process)
+    finally:
+        # Kill server
+        server_process.terminate()
+        server_process.wait()
+
+async def _run_checks(check_server=True, verbose=False, reuse_server=False):
+    """Run the unit tests and, unless disabled, the server check concurrently."""
+    if not check_server:
+        return await asyncio.to_thread(_run_unit_tests, verbose, reuse_server), (False, None)
+    return await asyncio.gather(
+        asyncio.to_thread(_run_unit_tests, verbose, reuse_server),
+        asyncio.to_thread(_check_server, reuse_server)
+    )
+
+def verify_working_solution(skip_ai=False, check_server=True, verbose=False, reuse_server=False):
+    """Verify the MCP integration is working
+
+    The AI SDKs are only imported in stage 3, so ``skip_ai`` avoids
+    loading them at all. ``reuse_server`` keeps the server process alive
+    between calls in the same interpreter (e.g. CI or watch loops); the
+    unit tests then run in a subprocess so they also pick up edits.
+    """
     print("🎯 FINAL VERIFICATION: MCP Integration Working Solution")
     print("=" * 60)
 
     print("\n1. 🧪 RUNNING UNIT TESTS - PROVES FUNCTIONALITY WORKS")
     print("-" * 50)
 
-    # Run unit tests to prove functionality
-    result = subprocess.run([
-        sys.executable, "-m", "pytest",
-        "tests/unit/test_server_functions.py",
-        "-v", "--tb=short"
-    ], capture_output=True, text=True)
+    # Unit tests run while the server boots; server results are reported in stage 2
+    (exit_code, output), (ready, status_code) = asyncio.run(_run_checks(check_server, verbose, reuse_server))
 
-    if result.returncode == 0:
+    if exit_code == 0:
         print("✅ UNIT TESTS PASSED - Core functionality verified!")
         print("   • World generation: Working")
         print("   • Character creation: Working")
@@ -31,81 +206,78 @@ def verify_working_solution():
         print("   • Error handling: Working")
     else:
         print("❌ Unit tests failed")
-        print(result.stdout)
+        print(output)
         return False
 
     print("\n2. 🚀 TESTING SERVER STARTUP - PROVES MCP INFRASTRUCTURE WORKS")
     print("-" * 50)
 
-    # Start server in background
-    print("Starting MCP server...")
-    server_process = subprocess.Popen([
-        sys.executable, "server.py"
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if not check_server:
+        print("⏭️ Skipped (--no-server)")
+    else:
+        if not ready:
+            print("⚠️ Server did not open port 8000 in time")
 
-    import time
-    time.sleep(3)  # Wait for server to start
+        # A plain GET on /mcp is answered with a 4xx by a healthy server; 5xx means it is broken
+        server_running = status_code is not None and status_code < 500
 
-    # Check if server is running
-    try:
-        import requests
-        response = requests.get("http://localhost:8000/mcp", timeout=2)
-        print(f"✅ Server responding on port 8000 (Status: {response.status_code})")
-        server_running = True
-    except:
-        print("❌ Server not responding")
-        server_running = False
-
-    # Kill server
-    server_process.terminate()
-    server_process.wait()
-
-    if server_running:
-        print("✅ MCP server infrastructure: Working")
-    else:
-        print("❌ MCP server infrastructure: Failed")
-        return False
+        if server_running:
+            print(f"✅ Server responding on port 8000 (Status: {status_code})")
+        elif status_code is not None:
+            print(f"❌ Server error on port 8000 (Status: {status_code})")
+        else:
+            print("❌ Server not responding")
+
+        if server_running:
+            print("✅ MCP server infrastructure: Working")
+        else:
+            print("❌ MCP server infrastructure: Failed")
+            return False
 
     print("\n3. 🤖 TESTING AI INTEGRATIONS")
     print("-" * 50)
 
-    # Test Direct LangChain Integration
-    print("Testing Direct LangChain Integration...")
-    try:
-        import openai_working_integration
+    if skip_ai:
+        print("⏭️ Skipped (--skip-ai)")
+        direct_integration = mcp_use_integration = False
+    else:
+        # Test Direct LangChain Integration
+        print("Testing Direct LangChain Integration...")
+        try:
+            import openai_working_integration
 
-        print("✅ Direct LangChain integration imports successfully")
-        direct_integration = True
-    except Exception as e:
-        print(f"❌ Direct LangChain integration failed: {e}")
-        direct_integration = False
+            print("✅ Direct LangChain integration imports successfully")
+            direct_integration = True
+        except Exception as e:
+            print(f"❌ Direct LangChain integration failed: {e}")
+            direct_integration = False
 
-    # Test mcp_use Integration
-    print("Testing mcp_use Integration...")
-    try:
-        from mcp_use import MCPClient, MCPAgent
-        from langchain_openai import ChatOpenAI
-        import os
-
-        config = {
-            "mcpServers": {
-                "game_world": {
-                    "command": "python",
-                    "args": ["-m", "server"],
-                    "env": {"PYTHONPATH": os.getcwd()}
+        # Test mcp_use Integration
+        print("Testing mcp_use Integration...")
+        try:
+            from mcp_use import MCPClient, MCPAgent
+            from langchain_openai import ChatOpenAI
+            import os
+
+            config = {
+                "mcpServers": {
+                    "game_world": {
+                        "command": "python",
+                        "args": ["-m", "server"],
+                        "env": {"PYTHONPATH": os.getcwd()}
+                    }
                 }
             }
-        }
 
-        client = MCPClient.from_dict(config)
-        llm = ChatOpenAI(model="gpt-4o-mini")
-        agent = MCPAgent(llm=llm, client=client, max_steps=30)
+            client = MCPClient.from_dict(config)
+            llm = ChatOpenAI(model="gpt-4o-mini")
+            agent = MCPAgent(llm=llm, client=client, max_steps=30)
 
-        print("✅ mcp_use integration initializes successfully")
-        mcp_use_integration = True
-    except Exception as e:
-        print(f"❌ mcp_use integration failed: {e}")
-        mcp_use_integration = False
+            print("✅ mcp_use integration initializes successfully")
+            mcp_use_integration = True
+        except Exception as e:
+            print(f"❌ mcp_use integration failed: {e}")
+            mcp_use_integration = False
 
     print("\n4. 📊 ANALYSIS OF WORKING SOLUTION")
     print("-" * 50)
@@ -160,5 +332,12 @@ def verify_working_solution():
     return True
 
 if __name__ == "__main__":
-    success = verify_working_solution()
+    parser = argparse.ArgumentParser(description="Verify the MCP integration")
+    parser.add_argument("--skip-ai", action="store_true", help="skip the AI integration checks")
+    parser.add_argument("--no-server", action="store_true", help="skip the server startup check")
+    parser.add_argument("-v", "--verbose", action="store_true", help="stream the unit test output live")
+    args = parser.parse_args()
+
+    success = verify_working_solution(skip_ai=args.skip_ai, check_server=not args.no_server,
+                                      verbose=args.verbose)
     exit(0 if success else 1)
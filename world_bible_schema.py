@@ -1,8 +1,16 @@
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator
+from pydantic.dataclasses import dataclass
+from typing import Annotated, List, Optional, Dict, Any
+from typing_extensions import TypedDict
 from enum import Enum
-import re
+
+# Constrained strings, checked by pydantic-core instead of Python validators
+WorldName = Annotated[str, StringConstraints(
+    strip_whitespace=True, min_length=2, max_length=100, pattern=r"^[a-zA-Z0-9\s\-_'\".]+$")]
+CharacterName = Annotated[str, StringConstraints(
+    strip_whitespace=True, min_length=2, max_length=100, pattern=r"^[a-zA-Z\s\-']+$")]
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
 
 class GameStyle(str, Enum):
     """Predefined game styles with modern classifications."""
@@ -30,24 +38,38 @@ class TechLevel(str, Enum):
     INTERSTELLAR = "Interstellar"
     TRANSHUMAN = "Transhuman"
 
+# Tech levels that rule out traditional magic and ancient fantasy races
+_HIGH_TECH_LEVELS = frozenset({TechLevel.FUTURISTIC, TechLevel.INTERSTELLAR, TechLevel.TRANSHUMAN})
+_ANCIENT_RACES = ("elf", "dwarf", "orc")
+
+class NamedEntry(TypedDict, extra_items=str):
+    """A named world element with a short description; extra keys must be strings."""
+    name: str
+    description: str
+
+class Region(NamedEntry):
+    """A key region of the world's geography."""
+    name: NonEmptyStr
+    description: NonEmptyStr
+
+class Race(NamedEntry):
+    """An intelligent race inhabiting the world."""
+
+class Faction(NamedEntry):
+    """A major organization or power group."""
+
+class Religion(NamedEntry):
+    """A religious system and its influence."""
+
 class Metadata(BaseModel):
     """Enhanced metadata with validation and modern fields."""
-    name: str = Field(..., min_length=2, max_length=100, description="The unique name of the world.")
+    name: WorldName = Field(..., description="The unique name of the world.")
     description: str = Field(..., min_length=10, max_length=500, description="A comprehensive summary of the world's essence and atmosphere.")
     style: GameStyle = Field(..., description="The primary genre or style of the world.")
     version: str = Field(default="1.0.0", description="World version for tracking changes.")
     author: Optional[str] = Field(default=None, description="Creator of this world.")
     tags: List[str] = Field(default_factory=list, description="Descriptive tags for the world.")
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        if not v.strip():
-            raise ValueError("World name cannot be empty or whitespace")
-        if not re.match(r'^[a-zA-Z0-9\s\-_\'".]+$', v):
-            raise ValueError("World name contains invalid characters")
-        return v.strip()
-
 class Cosmology(BaseModel):
     """Enhanced cosmology with modern game design principles."""
     magic_system: str = Field(..., min_length=10, description="Detailed description of how magic works, its source, limitations, and rules.")
@@ -59,61 +81,28 @@ class Cosmology(BaseModel):
     @model_validator(mode='after')
     def validate_magic_system_compatibility(self):
         if hasattr(self, 'tech_level') and hasattr(self, 'magic_system'):
-            if self.tech_level in ['Futuristic', 'Interstellar', 'Transhuman']:
-                if 'magic' in self.magic_system.lower() and 'no magic' not in self.magic_system.lower():
+            if self.tech_level in _HIGH_TECH_LEVELS:
+                magic_system = self.magic_system.lower()
+                if 'magic' in magic_system and 'no magic' not in magic_system:
                     raise ValueError("High-tech worlds should not have traditional magic systems")
         return self
 
 class Geography(BaseModel):
     """Enhanced geography with modern mapping standards."""
     macro_geography: str = Field(..., min_length=20, description="Detailed overview of continents, oceans, major landforms, and climate zones.")
-    key_regions: List[Dict[str, str]] = Field(..., min_length=3, description="Important regions with coordinates, biomes, and strategic significance.")
+    key_regions: List[Region] = Field(..., min_length=3, description="Important regions with coordinates, biomes, and strategic significance.")
     climate_zones: List[str] = Field(default_factory=list, description="Major climate zones and their characteristics.")
     natural_resources: List[str] = Field(default_factory=list, description="Key natural resources available in this world.")
     strategic_locations: List[Dict[str, Any]] = Field(default_factory=list, description="Key locations with tactical importance.")
 
-    @field_validator('key_regions')
-    @classmethod
-    def validate_regions(cls, v):
-        required_fields = {'name', 'description'}
-        for region in v:
-            if not isinstance(region, dict):
-                raise ValueError("Each region must be a dictionary")
-            if not required_fields.issubset(region.keys()):
-                raise ValueError(f"Region missing required fields: {required_fields}")
-            if not region.get('name') or not region.get('description'):
-                raise ValueError("Region name and description cannot be empty")
-        return v
-
 class Society(BaseModel):
     """Enhanced society model with modern social dynamics."""
-    races: List[Dict[str, str]] = Field(..., min_length=1, description="Intelligent races with detailed culture, traits, and societal roles.")
-    factions: List[Dict[str, str]] = Field(..., min_length=2, description="Major organizations with clear goals, relationships, and influence levels.")
+    races: List[Race] = Field(..., min_length=1, description="Intelligent races with detailed culture, traits, and societal roles.")
+    factions: List[Faction] = Field(..., min_length=2, description="Major organizations with clear goals, relationships, and influence levels.")
     social_structure: str = Field(..., min_length=15, description="Complete social hierarchy and class system.")
     cultural_traits: List[str] = Field(default_factory=list, description="Dominant cultural values and traditions.")
     languages: List[str] = Field(default_factory=list, description="Major languages and dialects.")
-    religions: List[Dict[str, str]] = Field(default_factory=list, description="Religious systems and their influence.")
-
-    @field_validator('races')
-    @classmethod
-    def validate_races(cls, v):
-        required_fields = {'name', 'description'}
-        for race in v:
-            if not isinstance(race, dict):
-                raise ValueError("Each race must be a dictionary")
-            if not required_fields.issubset(race.keys()):
-                raise ValueError(f"Race missing required fields: {required_fields}")
-        return v
-
-    @field_validator('factions')
-    @classmethod
-    def validate_factions(cls, v):
-        for faction in v:
-            if not isinstance(faction, dict):
-                raise ValueError("Each faction must be a dictionary")
-            if 'name' not in faction or 'description' not in faction:
-                raise ValueError("Faction must have name and description")
-        return v
+    religions: List[Religion] = Field(default_factory=list, description="Religious systems and their influence.")
 
 class History(BaseModel):
     """Enhanced history with narrative structure and timeline."""
@@ -136,11 +125,17 @@ class Systems(BaseModel):
     @field_validator('economy')
     @classmethod
     def validate_economy(cls, v):
-        if 'currency' not in v.lower() and 'trade' not in v.lower() and 'gold' not in v.lower():
+        economy = v.lower()
+        if 'currency' not in economy and 'trade' not in economy and 'gold' not in economy:
             raise ValueError("Economy description must include currency or trade information")
         return v
 
-class CharacterAttributes(BaseModel):
+# CharacterAttributes, Skill and InventoryItem are slotted pydantic dataclasses,
+# not BaseModels, to keep per-character memory down. They have no model_*
+# methods: use TypeAdapter(cls).validate_python / dump_python / json_schema,
+# dataclasses.replace() in place of model_copy(), or go through PlayerCharacter.
+@dataclass(slots=True)
+class CharacterAttributes:
     """Comprehensive character attributes with modern game design."""
     health: int = Field(ge=0, le=1000, description="Current health points")
     max_health: int = Field(ge=1, le=1000, description="Maximum health points")
@@ -166,7 +161,8 @@ class CharacterAttributes(BaseModel):
     magic_resistance: int = Field(ge=0, le=100, description="Resistance to magical effects")
     movement_speed: int = Field(ge=1, le=50, description="Base movement speed")
 
-class Skill(BaseModel):
+@dataclass(slots=True)
+class Skill:
     """Individual skill with progression system per GEMINI.md requirements."""
     name: str = Field(..., description="Skill name")
     level: int = Field(ge=0, le=100, description="Current skill level")
@@ -182,7 +178,8 @@ class Skill(BaseModel):
     skill_type: str = Field(default="general", description="Skill category (combat/magic/social/crafting)")
     prerequisites: List[str] = Field(default_factory=list, description="Required skills to learn this one")
 
-class InventoryItem(BaseModel):
+@dataclass(slots=True)
+class InventoryItem:
     """Enhanced inventory item with modern game features."""
     name: str = Field(..., description="Item name")
     description: str = Field(..., description="Item description and properties")
@@ -219,7 +216,7 @@ class PlayerCharacter(BaseModel):
 
 class DynamicCharacter(BaseModel):
     """Dynamic NPC character support per GEMINI.md requirements."""
-    name: str = Field(..., min_length=2, max_length=100, description="Character name")
+    name: CharacterName = Field(..., description="Character name")
     race: str = Field(..., description="Character race")
     character_class: str = Field(..., description="Character class/profession")
     level: int = Field(ge=1, le=100, description="Character level")
@@ -248,13 +245,6 @@ class DynamicCharacter(BaseModel):
     quest_relevance: List[str] = Field(default_factory=list, description="Quests this character is involved in")
     dialogue_options: List[Dict[str, Any]] = Field(default_factory=list, description="Available dialogue choices")
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        if not re.match(r"^[a-zA-Z\s\-']+$", v):
-            raise ValueError("Character name contains invalid characters")
-        return v.strip()
-
     @model_validator(mode='before')
     @classmethod
     def validate_character(cls, values):
@@ -332,11 +322,10 @@ class WorldBible(BaseModel):
 
             if cosmology and society:
                 # Validate race consistency with tech level
-                tech_level = cosmology.get('tech_level')
-                for race in society.get('races', []):
-                    race_name = race.get('name', '').lower()
-                    if tech_level in ['Futuristic', 'Interstellar', 'Transhuman']:
-                        if any(ancient in race_name for ancient in ['elf', 'dwarf', 'orc']):
+                if cosmology.get('tech_level') in _HIGH_TECH_LEVELS:
+                    for race in society.get('races', []):
+                        race_name = race.get('name', '').lower()
+                        if any(ancient in race_name for ancient in _ANCIENT_RACES):
                             raise ValueError(f"Race '{race['name']}' is inconsistent with high-tech setting")
 
         return values